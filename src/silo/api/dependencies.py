@@ -1,12 +1,15 @@
-import fnmatch
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from jwt.exceptions import PyJWTError
 from silo.database import async_get_db, models
+from silo.database.loaders import USER_LOAD
+from silo.log.context import request_context
 from silo.security.jwt import decode_token
+from silo.security.permissions import is_allowed
+from silo.security.sessions import revoked_sessions
+from silo.security.user_cache import user_cache
 from silo.schemas import UserRead
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -28,16 +31,31 @@ async def get_current_user(
     except PyJWTError:
         raise credentials_exc
 
+    # revoked sessions (logout, refresh token reuse, revoked by an admin)
+    session_id = payload.get("sid")
+    if session_id is not None and session_id in revoked_sessions:
+        raise credentials_exc
+
+    context = request_context.get()
+    if context is not None:
+        context.user_id = int(user_id)
+
+    issued_at = payload.get("iat")
+    cached_user = await user_cache.get(int(user_id), issued_at)
+    if cached_user is not None:
+        return cached_user
+
     result_u = await session.execute(
-        select(models.User)
-        .options(selectinload(models.User.roles))
-        .where(models.User.id == int(user_id))
+        select(models.User).options(*USER_LOAD).where(models.User.id == int(user_id))
     )
     user: models.User | None = result_u.scalars().first()
     if not user or not user.is_active:
         raise credentials_exc
 
-    return UserRead.model_validate(user)
+    current_user = UserRead.model_validate(user)
+    await user_cache.set(int(user_id), issued_at, current_user)
+
+    return current_user
 
 
 def require_permission():
@@ -45,19 +63,7 @@ def require_permission():
         path = request.url.path
         method = request.method.upper()
 
-        allowed = False
-        for role in current_user.roles:
-            if not role.permissions:
-                continue
-            for pattern, methods in role.permissions.items():
-                if fnmatch.fnmatch(path, pattern):
-                    if method in methods:
-                        allowed = True
-                        break
-            if allowed:
-                break
-
-        if not allowed:
+        if not is_allowed(current_user.roles, method, path):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Not allowed to {method} {path}",
@@ -15,6 +15,7 @@ from .role import role_router
 from .tag import tag_router
 from .comment import comment_router
 from .document import document_router
+from .database import database_router
 
 router = APIRouter()
 
@@ -33,3 +34,4 @@ router.include_router(user_router)
 router.include_router(role_router)
 router.include_router(comment_router)
 router.include_router(document_router)
+router.include_router(database_router)
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, Cookie
+import math
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, Cookie
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,10 +8,19 @@ from jwt.exceptions import PyJWTError
 
 from silo import config
 from silo.log import logger
+from silo.api.dependencies import require_permission
 from silo.database import async_get_db, models
-from silo.schemas import Token
-from silo.security.jwt import create_access_token, create_refresh_token, decode_token
-from silo.security.authenticator_factory import create_authenticator
+from silo.schemas import AuthenticatorStatus, Token
+from silo.security.jwt import create_access_token, decode_token
+from silo.security.authenticator_factory import get_authenticator
+from silo.security.rate_limit import login_rate_limiter
+from silo.security.sessions import (
+    InvalidSessionError,
+    create_session,
+    revoke_session,
+    rotate_session,
+)
+from silo.utils.client_ip import get_client_ip
 from silo.security.authenticator.exceptions import (
     BindError,
     InvalidCredentialsError,
@@ -24,12 +35,27 @@ from silo.security.authenticator.exceptions import (
 auth_router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def set_refresh_cookie(response: Response, refresh_token: str) -> None:
+    response.set_cookie(
+        key="refresh_token",
+        value=refresh_token,
+        httponly=True,
+        secure=True,
+        samesite="strict",
+        max_age=config.jwt_refresh_token_expire_days * 24 * 3600,
+    )
+
+
 @auth_router.post(
     "/refresh",
-    description="Refresh access token using refresh token",
+    description="Refresh access token using refresh token. The refresh token is rotated, using a refresh token again (after a grace period of a few seconds) revokes the session.",
     summary="Refresh access token",
 )
-async def refresh_token(refresh_token: str = Cookie(None)):
+async def refresh_token(
+    response: Response,
+    refresh_token: str = Cookie(None),
+    session: AsyncSession = Depends(async_get_db),
+) -> Token:
     if not refresh_token:
         raise HTTPException(status_code=401, detail="Missing refresh token")
 
@@ -39,20 +65,36 @@ async def refresh_token(refresh_token: str = Cookie(None)):
         if not token_type == "refresh":
             raise HTTPException(status_code=401, detail="Invalid token type")
 
-        user_id = payload.get("sub")
-        new_access_token = create_access_token(user_id)
-        return {"access_token": new_access_token, "token_type": "bearer"}
-
-    except PyJWTError:
+        new_refresh_token, session_id, user_id = await rotate_session(session, payload)
+        await session.commit()
+    except (PyJWTError, InvalidSessionError):
+        response.delete_cookie("refresh_token")
         raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
 
+    set_refresh_cookie(response, new_refresh_token)
+    new_access_token = create_access_token(str(user_id), sid=session_id)
+    return {"access_token": new_access_token, "token_type": "bearer"}
+
 
 @auth_router.post(
     "/logout",
-    description="Logout",
+    description="Logout, revokes the session of the refresh token",
     summary="Logout",
 )
-async def logout(response: Response):
+async def logout(
+    response: Response,
+    refresh_token: str = Cookie(None),
+    session: AsyncSession = Depends(async_get_db),
+):
+    if refresh_token:
+        try:
+            payload = decode_token(refresh_token)
+            if payload.get("fam"):
+                await revoke_session(session, payload["fam"])
+                await session.commit()
+        except PyJWTError:
+            pass
+
     response.delete_cookie("refresh_token")
     return {"detail": "Logged out"}
 
@@ -61,8 +103,10 @@ async def logout(response: Response):
     "/login",
     description="Get an access token using OAuth2 password flow",
     summary="Get an access token",
+    responses={429: {"description": "Too many login attempts (see Retry-After)"}},
 )
 async def login(
+    request: Request,
     response: Response,
     form_data: OAuth2PasswordRequestForm = Depends(),
     session: AsyncSession = Depends(async_get_db),
@@ -70,19 +114,37 @@ async def login(
     username = form_data.username
     password = form_data.password
 
-    authenticator = create_authenticator()
+    # throttled before any directory or database work
+    client_ip = get_client_ip(request)
+    retry_after = await login_rate_limiter.check_login(username, client_ip)
+    if retry_after > 0:
+        logger.warning(
+            "Too many login attempts for user %s from %s", username, client_ip
+        )
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+    failure_key = login_rate_limiter.failure_key(username, client_ip)
+
+    authenticator = get_authenticator()
     try:
-        authenticate = authenticator.authenticate(username=username, password=password)
+        authenticate = await authenticator.async_authenticate(
+            username=username, password=password
+        )
         if authenticate is False:
             raise InvalidCredentialsError()
     except InvalidCredentialsError:
         logger.info("Invalid credentials for user %s", username)
+        await login_rate_limiter.add_failure(failure_key)
         raise HTTPException(status_code=401, detail="Invalid credentials")
     except AuthenticationError as e:
         logger.error("Error authenticating user %s: %s", username, e)
         raise HTTPException(status_code=503, detail=f"Error authenticating user: {e}")
     except UserNotFound:
         logger.info("The user %s does not exists in authenticator source", username)
+        await login_rate_limiter.add_failure(failure_key)
         raise HTTPException(status_code=401, detail="Invalid credentials")
     except BindNotAllowedError:
         logger.error("Not allowed to fetch user data for user %s?", username)
@@ -100,6 +162,8 @@ async def login(
         logger.error("Error binding user %s: %s", username, e)
         raise HTTPException(status_code=401, detail=f"Error binding user: {e}")
 
+    await login_rate_limiter.reset(failure_key)
+
     result = await session.scalars(
         select(models.User).where(models.User.username == username)
     )
@@ -113,15 +177,20 @@ async def login(
     if not user.is_active:
         raise HTTPException(status_code=403, detail="User is inactive")
 
-    access_token = create_access_token(sub=str(user.id))
-    refresh_token = create_refresh_token(sub=str(user.id))
-    response.set_cookie(
-        key="refresh_token",
-        value=refresh_token,
-        httponly=True,
-        secure=True,
-        samesite="strict",
-        max_age=config.jwt_refresh_token_expire_days * 24 * 3600,
-    )
+    refresh_token, session_id = create_session(session, user.id)
+    await session.commit()
+
+    access_token = create_access_token(sub=str(user.id), sid=session_id)
+    set_refresh_cookie(response, refresh_token)
 
     return {"access_token": access_token, "token_type": "bearer"}
+
+
+@auth_router.get(
+    "/status",
+    summary="Get the authenticator thread and connection pool status of this worker",
+    response_model=AuthenticatorStatus,
+    dependencies=[Depends(require_permission())],
+)
+async def get_authenticator_status() -> AuthenticatorStatus:
+    return AuthenticatorStatus(**get_authenticator().status())
@@ -1,11 +1,13 @@
-from fastapi import Depends, APIRouter, HTTPException
+from fastapi import Depends, APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from silo.api.dependencies import get_current_user, require_permission
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
-from silo.schemas import CommentCreate, CommentRead
+from silo.utils import ExportFormat, paginate, stream_export
+from silo.schemas import CommentCreate, CommentRead, CursorParams, Page
 from silo.schemas.User import UserRead
 
 comment_router = APIRouter(
@@ -13,10 +15,21 @@ comment_router = APIRouter(
 )
 
 
+@comment_router.get(
+    "/comment/export",
+    summary="Export all Comments",
+    response_class=StreamingResponse,
+)
+async def export_comments(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+) -> StreamingResponse:
+    return stream_export(select(models.Comment), CommentRead, fmt, filename="comments")
+
+
 @comment_router.get(
     "/comment/",
     summary="Get all Comments",
-    response_model=list[CommentRead],
+    response_model=list[CommentRead] | Page[CommentRead],
 )
 @comment_router.get(
     "/comment/{id}",
@@ -24,8 +37,10 @@ comment_router = APIRouter(
     response_model=CommentRead,
 )
 async def get_comments(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> CommentRead | list[CommentRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> CommentRead | list[CommentRead] | Page[CommentRead]:
     if id is not None:
         result = await session.scalars(
             select(models.Comment).where(models.Comment.id == id)
@@ -37,13 +52,7 @@ async def get_comments(
 
         raise HTTPException(status_code=404, detail=f"Comment {id} not found")
 
-    result = await session.scalars(select(models.Comment))
-    comments = result.all()
-
-    return [
-        CommentRead.model_validate(comment, from_attributes=True)
-        for comment in comments
-    ]
+    return await paginate(session, select(models.Comment), page, CommentRead)
 
 
 @comment_router.post(
@@ -0,0 +1,18 @@
+from fastapi import Depends, APIRouter
+
+from silo.api.dependencies import require_permission
+from silo.database import async_engine, pool_status
+from silo.schemas import PoolStatus
+
+database_router = APIRouter(
+    tags=["Database"], dependencies=[Depends(require_permission())]
+)
+
+
+@database_router.get(
+    "/database/pool",
+    summary="Get the connection pool status of this worker",
+    response_model=PoolStatus,
+)
+async def get_pool_status() -> PoolStatus:
+    return PoolStatus(**pool_status(async_engine.pool))
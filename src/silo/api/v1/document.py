@@ -1,27 +1,144 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from email.utils import format_datetime, parsedate_to_datetime
 from typing import Annotated, Literal
-from fastapi import Depends, APIRouter, File, Form, HTTPException, UploadFile
+from urllib.parse import quote
+from fastapi import (
+    BackgroundTasks,
+    Depends,
+    APIRouter,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
+from fastapi.responses import (
+    FileResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from silo import config
 from silo.api.dependencies import get_current_user, require_permission
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
-from silo.schemas import DocumentCreate, DocumentUpdate, DocumentRead, DocumentMimeTypes
+from silo.schemas import (
+    CursorParams,
+    DocumentCreate,
+    DocumentUpdate,
+    DocumentRead,
+    DocumentMimeTypes,
+    Page,
+)
 from silo.schemas.Document import DocumentType
 from silo.schemas.User import UserRead
-from silo.utils import DocumentManager
+from silo.utils import DocumentManager, ExportFormat, paginate, stream_export
+from silo.utils.metrics import observe_upload
+from silo.utils.thumbnails import THUMBNAIL_MIME_TYPE, generate_thumbnails
 
 doc_manager = DocumentManager()
 
+
+def not_modified(request: Request, etag: str | None, last_modified: datetime) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # "-0000" (no zone information) is parsed as naive datetime
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+async def serve_file(
+    request: Request,
+    key: str,
+    media_type: str,
+    filename: str,
+    etag: str | None,
+    last_modified: datetime,
+) -> Response:
+    # stored files never change (content addressed)
+    last_modified = last_modified.astimezone(timezone.utc)
+    headers = {
+        "Cache-Control": "private, max-age=31536000, immutable",
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+    }
+    if etag:
+        headers["ETag"] = f'"{etag}"'
+
+    if not_modified(request, headers.get("ETag"), last_modified):
+        return Response(status_code=304, headers=headers)
+
+    # object storages serve the file themselves
+    url = await doc_manager.storage.presigned_url(
+        key,
+        filename=filename,
+        media_type=media_type,
+        expires=config.document_presigned_url_expire_seconds,
+    )
+    if url is not None:
+        return RedirectResponse(url, status_code=307)
+
+    # FileResponse handles Range requests and uses sendfile if the server supports it
+    file_path = doc_manager.storage.local_path(key)
+    if file_path is not None:
+        return FileResponse(
+            file_path,
+            media_type=media_type,
+            filename=filename,
+            content_disposition_type="inline",
+            headers=headers,
+        )
+
+    return StreamingResponse(
+        doc_manager.storage.read(key),
+        media_type=media_type,
+        headers={
+            **headers,
+            "Content-Disposition": f"inline; filename*=utf-8''{quote(filename)}",
+        },
+    )
+
+
 document_router = APIRouter(
     tags=["Document"], dependencies=[Depends(require_permission())]
 )
 
 
+@document_router.get(
+    "/document/export",
+    summary="Export all Documents",
+    response_class=StreamingResponse,
+)
+async def export_documents(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+) -> StreamingResponse:
+    return stream_export(
+        select(models.Document), DocumentRead, fmt, filename="documents"
+    )
+
+
 @document_router.get(
     "/document/",
     summary="Get all Documents",
-    response_model=list[DocumentRead],
+    response_model=list[DocumentRead] | Page[DocumentRead],
 )
 @document_router.get(
     "/document/{id}",
@@ -29,8 +146,10 @@ document_router = APIRouter(
     response_model=DocumentRead,
 )
 async def get_documents(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> DocumentRead | list[DocumentRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> DocumentRead | list[DocumentRead] | Page[DocumentRead]:
     if id is not None:
         result = await session.scalars(
             select(models.Document).where(models.Document.id == id)
@@ -42,13 +161,80 @@ async def get_documents(
 
         raise HTTPException(status_code=404, detail=f"Document {id} not found")
 
-    result = await session.scalars(select(models.Document))
-    comments = result.all()
+    return await paginate(session, select(models.Document), page, DocumentRead)
 
-    return [
-        DocumentRead.model_validate(comment, from_attributes=True)
-        for comment in comments
-    ]
+
+@document_router.get(
+    "/document/{id}/content",
+    summary="Download the file of a Document",
+    response_class=FileResponse,
+    responses={
+        206: {"description": "Partial content (Range request)"},
+        307: {"description": "Redirect to a presigned URL of the object storage"},
+        304: {"description": "Not modified"},
+        404: {"description": "Document not found"},
+    },
+)
+async def get_document_content(
+    id: int, request: Request, session: AsyncSession = Depends(async_get_read_db)
+):
+    document = await session.get(models.Document, id)
+    if document is None:
+        raise HTTPException(status_code=404, detail=f"Document {id} not found")
+
+    if not await doc_manager.storage.exists(document.file_path):
+        raise HTTPException(status_code=404, detail=f"File of Document {id} not found")
+
+    return await serve_file(
+        request,
+        document.file_path,
+        media_type=document.mime_type.value,
+        filename=document.filename,
+        etag=document.content_hash,
+        last_modified=document.created_at,
+    )
+
+
+@document_router.get(
+    "/document/{id}/thumbnail",
+    summary="Get a thumbnail of an image or PDF Document",
+    response_class=FileResponse,
+    responses={
+        307: {"description": "Redirect to a presigned URL of the object storage"},
+        304: {"description": "Not modified"},
+        404: {"description": "Document or thumbnail not found"},
+    },
+)
+async def get_document_thumbnail(
+    id: int,
+    request: Request,
+    size: int = Query(256, gt=0, description="Longest edge in pixels"),
+    session: AsyncSession = Depends(async_get_read_db),
+):
+    document = await session.get(models.Document, id)
+    if document is None:
+        raise HTTPException(status_code=404, detail=f"Document {id} not found")
+
+    if not document.content_hash or not config.document_thumbnail_sizes:
+        raise HTTPException(status_code=404, detail=f"No thumbnail for Document {id}")
+
+    # smallest available size that is at least as large as requested
+    sizes = sorted(config.document_thumbnail_sizes)
+    size = next((available for available in sizes if available >= size), sizes[-1])
+
+    key = doc_manager.thumbnail_key(document.content_hash, size)
+    # thumbnails are generated in the background after the upload
+    if not await doc_manager.storage.exists(key):
+        raise HTTPException(status_code=404, detail=f"No thumbnail for Document {id}")
+
+    return await serve_file(
+        request,
+        key,
+        media_type=THUMBNAIL_MIME_TYPE,
+        filename=f"{Path(document.filename).stem}_{size}.webp",
+        etag=f"{document.content_hash}-{size}",
+        last_modified=document.created_at,
+    )
 
 
 @document_router.post(
@@ -68,14 +254,15 @@ async def new_document(
     item_id: Annotated[
         int, Form(gt=0, description="The Item ID to map the document to")
     ],
+    background_tasks: BackgroundTasks,
     document_type: Annotated[
         Literal["manual", "image", "other"], Form(description="Document type")
     ] = "other",
     session: AsyncSession = Depends(async_get_db),
     user: UserRead = Depends(get_current_user),
 ) -> DocumentRead:
-    file_metadata = await doc_manager.validate(file)
-    file_path = await doc_manager.save(file)
+    file_metadata = await doc_manager.save(file)
+    observe_upload(file_metadata["size"])
 
     document_create = DocumentCreate(
         filename=file.filename,
@@ -85,15 +272,27 @@ async def new_document(
         mime_type=DocumentMimeTypes(file_metadata["mime_type"]),
         document_type=document_type,
         item_id=item_id,
-        file_path=file_path,
+        file_path=file_metadata["file_path"],
+        content_hash=file_metadata["content_hash"],
         user_id=user.id,
     )
 
+    # the file may be shared with other documents, an orphan left behind by a
+    # failed commit is removed by the garbage collection (silo.utils.gc_documents)
     new_document = models.Document(**document_create.model_dump())
     session.add(new_document)
     await session.commit()
     await session.refresh(new_document)
 
+    # CPU heavy, runs in a process pool after the response is sent
+    background_tasks.add_task(
+        generate_thumbnails,
+        doc_manager,
+        new_document.file_path,
+        new_document.content_hash,
+        new_document.mime_type.value,
+    )
+
     return DocumentRead.model_validate(new_document, from_attributes=True)
 
 
@@ -145,5 +344,8 @@ async def delete_document(id: int, session: AsyncSession = Depends(async_get_db)
     if document is None:
         raise HTTPException(404, detail="Document not found")
 
+    file_path = document.file_path
     await session.delete(document)
     await session.commit()
+
+    await doc_manager.release(session, file_path)
@@ -1,58 +1,136 @@
-from fastapi import Depends, APIRouter, HTTPException
+from collections import defaultdict
+from typing import Annotated
+from fastapi import Body, Depends, APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import func, select, or_, and_, inspect, delete
+from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    ARRAY,
+    ColumnElement,
+    Integer,
+    any_,
+    bindparam,
+    select,
+    inspect,
+    insert,
+    update,
+    delete,
+)
 
 from silo.api.dependencies import require_permission
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
-from silo.schemas import ItemCreate, ItemRead, ItemSearch
+from silo.database.loaders import ITEM_LOAD
+from silo.database.search import item_search
+from silo.database.silo_id import allocate_silo_ids
+from silo.utils import ExportFormat, paginate, stream_export
+from silo.schemas import (
+    CursorParams,
+    ItemBulkCreateResult,
+    ItemBulkDelete,
+    ItemBulkError,
+    ItemBulkMove,
+    ItemBulkResult,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemFilter,
+    ItemRead,
+    ItemSearch,
+    Page,
+)
 from silo.log import api_logger
 
 items_router = APIRouter(tags=["Item"], dependencies=[Depends(require_permission())])
 
 
+def filter_conditions(
+    params: ItemFilter,
+) -> tuple[list[ColumnElement[bool]], ColumnElement[float] | None]:
+    # no joins, the conditions are also used in UPDATE statements
+    conditions = []
+    rank = None
+
+    if params.term:
+        condition, rank = item_search(params.term)
+        conditions.append(condition)
+
+    area_conditions = []
+    if params.room_id:
+        area_conditions.append(models.StorageArea.room_id == params.room_id)
+    if params.furniture_id:
+        area_conditions.append(models.StorageArea.furniture_id == params.furniture_id)
+    if area_conditions:
+        conditions.append(
+            models.Item.storage_area_id.in_(
+                select(models.StorageArea.id).where(*area_conditions)
+            )
+        )
+
+    return conditions, rank
+
+
+def id_in(ids: list[int]) -> ColumnElement[bool]:
+    # one array parameter instead of one parameter per id
+    return models.Item.id == any_(bindparam("ids", ids, type_=ARRAY(Integer)))
+
+
+async def reload_item(session: AsyncSession, id: int) -> models.Item:
+    # after a commit, onupdate columns are expired and relationships raise
+    return await session.get(models.Item, id, options=ITEM_LOAD, populate_existing=True)
+
+
+async def check_storage_area(session: AsyncSession, storage_area_id: int) -> None:
+    if await session.get(models.StorageArea, storage_area_id) is None:
+        raise HTTPException(404, detail=f"StorageArea {storage_area_id} not found")
+
+
 @items_router.get(
     "/item/search",
     summary="Search Items",
-    response_model=list[ItemRead],
+    response_model=list[ItemRead] | Page[ItemRead],
 )
 async def search_items(
     params: ItemSearch = Depends(),
-    session: AsyncSession = Depends(async_get_db),
+    session: AsyncSession = Depends(async_get_read_db),
 ):
-    search_conditions = []
-    statement = select(models.Item)
-
-    if params.term:
-        search_conditions.append(
-            or_(
-                models.Item.name.ilike(f"%{params.term}%"),
-                models.Item.description.ilike(f"%{params.term}%"),
-            )
-        )
-
-    if params.room_id:
-        statement = statement.join(models.Item.storage_area)
-        search_conditions.append(models.StorageArea.room_id == params.room_id)
+    conditions, rank = filter_conditions(params)
+    keys = None
+    if rank is not None and params.order_by == "relevance":
+        keys = [(rank, True), (models.Item.id, True)]
+
+    statement = (
+        select(models.Item)
+        .options(*ITEM_LOAD)
+        .where(*conditions, models.Item.deleted.is_(False))
+    )
 
-    if params.furniture_id:
-        if not params.room_id:
-            statement = statement.join(models.Item.storage_area)
-        search_conditions.append(models.StorageArea.furniture_id == params.furniture_id)
+    return await paginate(
+        session,
+        statement,
+        params,
+        ItemRead,
+        keys=keys,
+        offset=params.offset,
+    )
 
-    if search_conditions:
-        statement = statement.where(and_(*search_conditions))
-    # pagination
-    statement = statement.limit(params.limit).offset(params.offset)
 
-    result = await session.scalars(statement.where(models.Item.deleted.is_(False)))
-    return result.all()
+@items_router.get(
+    "/item/export",
+    summary="Export all Items",
+    response_class=StreamingResponse,
+)
+async def export_items(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+) -> StreamingResponse:
+    return stream_export(
+        select(models.Item).options(*ITEM_LOAD), ItemRead, fmt, filename="items"
+    )
 
 
 @items_router.get(
     "/item/",
     summary="Get all Items",
-    response_model=list[ItemRead],
+    response_model=list[ItemRead] | Page[ItemRead],
 )
 @items_router.get(
     "/item/{id}",
@@ -61,21 +139,20 @@ async def search_items(
     responses={403: {"description": "Forbidden – missing required permissions"}},
 )
 async def get_items(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> ItemRead | list[ItemRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> ItemRead | list[ItemRead] | Page[ItemRead]:
     if id is not None:
-        result = await session.scalars(select(models.Item).where(models.Item.id == id))
-        item = result.one_or_none()
-
+        item = await session.get(models.Item, id, options=ITEM_LOAD)
         if item is not None:
             return ItemRead.model_validate(item)
 
         raise HTTPException(status_code=404, detail=f"Item {id} not found")
 
-    result = await session.scalars(select(models.Item))
-    items = result.all()
-
-    return [ItemRead.model_validate(item, from_attributes=True) for item in items]
+    return await paginate(
+        session, select(models.Item).options(*ITEM_LOAD), page, ItemRead
+    )
 
 
 @items_router.get(
@@ -86,11 +163,13 @@ async def get_items(
 )
 async def get_item_by_silo_id(
     silo_id: str,
-    session: AsyncSession = Depends(async_get_db),
+    session: AsyncSession = Depends(async_get_read_db),
 ):
     if silo_id is not None:
         result = await session.scalars(
-            select(models.Item).where(models.Item.silo_id == silo_id)
+            select(models.Item)
+            .options(*ITEM_LOAD)
+            .where(models.Item.silo_id == silo_id)
         )
         item = result.one_or_none()
         if item is not None:
@@ -110,7 +189,7 @@ async def get_item_by_silo_id(
 async def assign_tag(
     item_id: int, tag_id: int, session: AsyncSession = Depends(async_get_db)
 ) -> ItemRead:
-    item: models.Item = await session.get(models.Item, item_id)
+    item: models.Item = await session.get(models.Item, item_id, options=ITEM_LOAD)
     if item is None:
         raise HTTPException(status_code=404, detail=f"Item {item_id} not found")
 
@@ -121,7 +200,7 @@ async def assign_tag(
     if tag not in item.tags:
         item.tags.append(tag)
         await session.commit()
-        await session.refresh(item)
+        item = await reload_item(session, item_id)
 
     return ItemRead.model_validate(item, from_attributes=True)
 
@@ -135,18 +214,18 @@ async def assign_tag(
 async def delete_assigned_tag(
     item_id: int, tag_id: int, session: AsyncSession = Depends(async_get_db)
 ) -> ItemRead:
-    item: ItemRead = session.get(models.Item, item_id)
+    item: models.Item = await session.get(models.Item, item_id, options=ITEM_LOAD)
     if item is None:
         raise HTTPException(status_code=404, detail=f"Item {item_id} not found")
 
-    tag = session.get(models.Tag, tag_id)
+    tag = await session.get(models.Tag, tag_id)
     if tag is None:
         raise HTTPException(status_code=404, detail=f"Tag {tag_id} not found")
 
     if tag in item.tags:
         item.tags.remove(tag)
         await session.commit()
-        await session.refresh(item)
+        item = await reload_item(session, item_id)
 
     return ItemRead.model_validate(item, from_attributes=True)
 
@@ -161,38 +240,93 @@ async def new_item(
     item: ItemCreate, session: AsyncSession = Depends(async_get_db)
 ) -> ItemRead:
     # no need to check if None, pydantic does validation
-    type_id = item.type_id
-    pool_id = item.pool_id
+    [(next_sequence_num, silo_id)] = await allocate_silo_ids(
+        session, item.type_id, item.pool_id
+    )
 
-    result = await session.scalars(
-        select(
-            func.max(models.Item.sequence_num).filter(
-                models.Item.type_id == type_id, models.Item.pool_id == pool_id
-            )
-        )
+    new_item = models.Item(
+        **item.model_dump(), sequence_num=next_sequence_num, silo_id=silo_id
     )
-    sequence_num = result.first()
+    session.add(new_item)
+    await session.commit()
 
-    next_sequence_num = (sequence_num or 0) + 1
+    return await reload_item(session, new_item.id)
 
-    result_type_name = await session.scalars(
-        select(models.ItemType.name).where(models.ItemType.id == type_id)
-    )
-    type_name = result_type_name.one_or_none()
-    result_pool_name = await session.scalars(
-        select(models.Pool.name).where(models.Pool.id == pool_id)
-    )
-    pool_name = result_pool_name.one_or_none()
 
-    silo_id = f"{type_name}-{pool_name}-{next_sequence_num:04d}"
+@items_router.post(
+    "/item/bulk",
+    summary="Add multiple Items",
+    response_model=ItemBulkCreateResult,
+    status_code=201,
+)
+async def new_items_bulk(
+    items: Annotated[list[ItemCreate], Body(min_length=1, max_length=1000)],
+    session: AsyncSession = Depends(async_get_db),
+) -> ItemBulkCreateResult:
+    errors: list[ItemBulkError] = []
+
+    # check all references with one query per referenced table
+    references = {
+        "type_id": models.ItemType,
+        "pool_id": models.Pool,
+        "storage_area_id": models.StorageArea,
+    }
+    existing = {}
+    for field, model in references.items():
+        ids = {getattr(item, field) for item in items}
+        result = await session.scalars(select(model.id).where(model.id.in_(ids)))
+        existing[field] = set(result.all())
+
+    groups: dict[tuple[int, int], list[int]] = defaultdict(list)
+    for index, item in enumerate(items):
+        missing = [
+            f"{model.__name__} {getattr(item, field)} not found"
+            for field, model in references.items()
+            if getattr(item, field) not in existing[field]
+        ]
+        if missing:
+            errors.append(ItemBulkError(index=index, detail=", ".join(missing)))
+        else:
+            groups[(item.type_id, item.pool_id)].append(index)
+
+    if not groups:
+        return ItemBulkCreateResult(errors=errors)
+
+    # one SILO id allocation per (type, pool), the counter rows stay locked until
+    # the commit and are locked in the same order by every request (no deadlocks)
+    rows = []
+    for type_id, pool_id in sorted(groups):
+        indexes = groups[(type_id, pool_id)]
+        silo_ids = await allocate_silo_ids(session, type_id, pool_id, len(indexes))
+        for index, (sequence_num, silo_id) in zip(indexes, silo_ids):
+            rows.append(
+                {
+                    **items[index].model_dump(),
+                    "sequence_num": sequence_num,
+                    "silo_id": silo_id,
+                }
+            )
 
-    new_item = models.Item(
-        **item.model_dump(), sequence_num=next_sequence_num, silo_id=silo_id
+    result = await session.scalars(
+        insert(models.Item).returning(models.Item.id, sort_by_parameter_order=True),
+        rows,
     )
-    session.add(new_item)
+    created_ids = result.all()
     await session.commit()
-    await session.refresh(new_item)
-    return new_item
+
+    result = await session.scalars(
+        select(models.Item)
+        .options(*ITEM_LOAD)
+        .where(models.Item.id.in_(created_ids))
+        .order_by(models.Item.id)
+    )
+    created = [
+        ItemRead.model_validate(item, from_attributes=True) for item in result.all()
+    ]
+
+    api_logger(f"Created {len(created)} items, {len(errors)} failed")
+
+    return ItemBulkCreateResult(created=created, errors=errors)
 
 
 @items_router.put(
@@ -213,7 +347,6 @@ async def update_item(
         setattr(item, k, v)
 
     await session.commit()
-    await session.refresh(item)
 
 
 @items_router.post(
@@ -226,7 +359,10 @@ async def clone_item(
     modifications: ItemCreate | None = None,
     session: AsyncSession = Depends(async_get_db),
 ):
-    item: models.Item = await session.get(models.Item, id)
+    # tags are copied to the clone
+    item: models.Item = await session.get(
+        models.Item, id, options=(selectinload(models.Item.tags),)
+    )
     if item is None:
         raise HTTPException(404, detail="Item not found")
 
@@ -234,14 +370,16 @@ async def clone_item(
 
     new_item_dict = {}
     for attribute in inspect_item.attrs:
-        if hasattr(item, attribute.key) and attribute.key not in [
+        # excluded attributes first, hasattr() would load them
+        if attribute.key not in [
             "id",
             "created_at",
             "updated_at",
             "storage_area",
+            "search_vector",
             "silo_id",
             "sequence_num",
-        ]:
+        ] and hasattr(item, attribute.key):
             value = getattr(item, attribute.key)
             new_item_dict[attribute.key] = value
 
@@ -250,26 +388,9 @@ async def clone_item(
     new_item_dict["deleted"] = False
 
     # handle SILO id
-    type_id = item.type_id
-    pool_id = item.pool_id
-    result = await session.scalars(
-        select(
-            func.max(models.Item.sequence_num).filter(
-                models.Item.type_id == type_id, models.Item.pool_id == pool_id
-            )
-        )
-    )
-    sequence_num = result.first()
-    next_sequence_num = (sequence_num or 0) + 1
-    result_type_name = await session.scalars(
-        select(models.ItemType.name).where(models.ItemType.id == type_id)
+    [(next_sequence_num, silo_id)] = await allocate_silo_ids(
+        session, item.type_id, item.pool_id
     )
-    type_name = result_type_name.one_or_none()
-    result_pool_name = await session.scalars(
-        select(models.Pool.name).where(models.Pool.id == pool_id)
-    )
-    pool_name = result_pool_name.one_or_none()
-    silo_id = f"{type_name}-{pool_name}-{next_sequence_num:04d}"
 
     # apply custom modifications
     if modifications:
@@ -281,9 +402,92 @@ async def clone_item(
     )
     session.add(new_item)
     await session.commit()
-    await session.refresh(new_item)
 
-    return new_item
+    return await reload_item(session, new_item.id)
+
+
+@items_router.patch(
+    "/item/bulk",
+    summary="Update multiple Items",
+    response_model=ItemBulkResult,
+)
+async def update_items_bulk(
+    bulk_update: ItemBulkUpdate, session: AsyncSession = Depends(async_get_db)
+) -> ItemBulkResult:
+    changes = bulk_update.changes.model_dump(exclude_unset=True)
+    if not changes:
+        raise HTTPException(400, detail="No changes given")
+
+    if changes.get("storage_area_id") is not None:
+        await check_storage_area(session, changes["storage_area_id"])
+
+    result = await session.execute(
+        update(models.Item)
+        .where(id_in(bulk_update.ids))
+        .values(**changes)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+    api_logger(f"Updated {result.rowcount} items ({', '.join(changes)})")
+
+    return ItemBulkResult(affected=result.rowcount)
+
+
+@items_router.patch(
+    "/item/bulk/move",
+    summary="Move multiple Items to another StorageArea",
+    response_model=ItemBulkResult,
+)
+async def move_items_bulk(
+    bulk_move: ItemBulkMove, session: AsyncSession = Depends(async_get_db)
+) -> ItemBulkResult:
+    await check_storage_area(session, bulk_move.storage_area_id)
+
+    result = await session.execute(
+        update(models.Item)
+        .where(id_in(bulk_move.ids))
+        .values(storage_area_id=bulk_move.storage_area_id)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+    api_logger(
+        f"Moved {result.rowcount} items to storage area {bulk_move.storage_area_id}"
+    )
+
+    return ItemBulkResult(affected=result.rowcount)
+
+
+@items_router.patch(
+    "/item/bulk/delete",
+    summary="Mark multiple Items as deleted",
+    response_model=ItemBulkResult,
+)
+async def mark_items_as_deleted_bulk(
+    bulk_delete: ItemBulkDelete, session: AsyncSession = Depends(async_get_db)
+) -> ItemBulkResult:
+    conditions = []
+    if bulk_delete.ids:
+        conditions.append(id_in(bulk_delete.ids))
+    if bulk_delete.filter is not None:
+        conditions.extend(filter_conditions(bulk_delete.filter)[0])
+
+    # never mark all items as deleted by accident
+    if not conditions:
+        raise HTTPException(400, detail="Either ids or a non-empty filter is required")
+
+    result = await session.execute(
+        update(models.Item)
+        .where(*conditions, models.Item.deleted.is_(False))
+        .values(deleted=True)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+    api_logger(f"Marked {result.rowcount} items as deleted")
+
+    return ItemBulkResult(affected=result.rowcount)
 
 
 @items_router.patch(
@@ -292,7 +496,7 @@ async def clone_item(
     status_code=204,
 )
 async def mark_item_as_deleted(id: int, session: AsyncSession = Depends(async_get_db)):
-    item: ItemRead = session.get(models.Item, id)
+    item = await session.get(models.Item, id)
 
     if item is None:
         raise HTTPException(404, detail="Item not found")
@@ -300,7 +504,6 @@ async def mark_item_as_deleted(id: int, session: AsyncSession = Depends(async_ge
     item.deleted = True
 
     await session.commit()
-    await session.refresh(item)
 
 
 @items_router.delete(
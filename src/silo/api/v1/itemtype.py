@@ -1,11 +1,13 @@
 from fastapi import Depends, APIRouter, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from silo.api.dependencies import require_permission
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
-from silo.schemas import ItemTypeCreate, ItemTypeRead
+from silo.utils import paginate
+from silo.schemas import CursorParams, ItemTypeCreate, ItemTypeRead, Page
 
 item_type_router = APIRouter(
     tags=["ItemType"], dependencies=[Depends(require_permission())]
@@ -15,7 +17,7 @@ item_type_router = APIRouter(
 @item_type_router.get(
     "/itemtype/",
     summary="Get all ItemTypes",
-    response_model=list[ItemTypeRead],
+    response_model=list[ItemTypeRead] | Page[ItemTypeRead],
 )
 @item_type_router.get(
     "/itemtype/{id}",
@@ -23,8 +25,10 @@ item_type_router = APIRouter(
     response_model=ItemTypeRead,
 )
 async def get_item_types(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> ItemTypeRead | list[ItemTypeRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> ItemTypeRead | list[ItemTypeRead] | Page[ItemTypeRead]:
     if id is not None:
         result = await session.scalars(
             select(models.ItemType).where(models.ItemType.id == id)
@@ -36,13 +40,7 @@ async def get_item_types(
 
         raise HTTPException(status_code=404, detail=f"ItemType {id} not found")
 
-    result = await session.scalars(select(models.ItemType))
-    item_types = result.all()
-
-    return [
-        ItemTypeRead.model_validate(item_type, from_attributes=True)
-        for item_type in item_types
-    ]
+    return await paginate(session, select(models.ItemType), page, ItemTypeRead)
 
 
 @item_type_router.post(
@@ -97,5 +95,8 @@ async def delete_item_type(id: int, session: AsyncSession = Depends(async_get_db
     if item_type is None:
         raise HTTPException(404, detail="ItemType not found")
 
-    await session.delete(item_type)
-    await session.commit()
+    try:
+        await session.delete(item_type)
+        await session.commit()
+    except IntegrityError:
+        raise HTTPException(409, detail="ItemType is still used by items")
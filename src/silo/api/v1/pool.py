@@ -1,11 +1,13 @@
 from fastapi import Depends, APIRouter, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from silo.api.dependencies import require_permission
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
-from silo.schemas import PoolCreate, PoolRead
+from silo.utils import paginate
+from silo.schemas import CursorParams, Page, PoolCreate, PoolRead
 
 pool_router = APIRouter(tags=["Pool"], dependencies=[Depends(require_permission())])
 
@@ -13,7 +15,7 @@ pool_router = APIRouter(tags=["Pool"], dependencies=[Depends(require_permission(
 @pool_router.get(
     "/pool/",
     summary="Get all Pools",
-    response_model=list[PoolRead],
+    response_model=list[PoolRead] | Page[PoolRead],
 )
 @pool_router.get(
     "/pool/{id}",
@@ -21,8 +23,10 @@ pool_router = APIRouter(tags=["Pool"], dependencies=[Depends(require_permission(
     response_model=PoolRead,
 )
 async def get_pools(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> PoolRead | list[PoolRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> PoolRead | list[PoolRead] | Page[PoolRead]:
     if id is not None:
         result = await session.scalars(select(models.Pool).where(models.Pool.id == id))
         pool = result.one_or_none()
@@ -32,10 +36,7 @@ async def get_pools(
 
         raise HTTPException(status_code=404, detail=f"Pool {id} not found")
 
-    result = await session.scalars(select(models.Pool))
-    pools = result.all()
-
-    return [PoolRead.model_validate(pool, from_attributes=True) for pool in pools]
+    return await paginate(session, select(models.Pool), page, PoolRead)
 
 
 @pool_router.post(
@@ -84,5 +85,8 @@ async def delete_pool(id: int, session: AsyncSession = Depends(async_get_db)):
     if pool is None:
         raise HTTPException(404, detail="Pool not found")
 
-    await session.delete(pool)
-    await session.commit()
+    try:
+        await session.delete(pool)
+        await session.commit()
+    except IntegrityError:
+        raise HTTPException(409, detail="Pool is still used by items")
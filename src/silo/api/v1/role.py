@@ -4,9 +4,12 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from silo.api.dependencies import require_permission
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
-from silo.schemas import Response, RoleCreate, RoleRead
+from silo.utils import paginate
+from silo.security.permissions import invalidate_role_permissions
+from silo.security.user_cache import user_cache
+from silo.schemas import CursorParams, Page, Response, RoleCreate, RoleRead
 
 role_router = APIRouter(tags=["Role"], dependencies=[Depends(require_permission())])
 
@@ -14,7 +17,7 @@ role_router = APIRouter(tags=["Role"], dependencies=[Depends(require_permission(
 @role_router.get(
     "/role/",
     summary="Get all Roles",
-    response_model=list[RoleRead],
+    response_model=list[RoleRead] | Page[RoleRead],
 )
 @role_router.get(
     "/role/{id}",
@@ -22,8 +25,10 @@ role_router = APIRouter(tags=["Role"], dependencies=[Depends(require_permission(
     response_model=RoleRead,
 )
 async def get_roles(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> RoleRead | list[RoleRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> RoleRead | list[RoleRead] | Page[RoleRead]:
     if id is not None:
         result = await session.scalars(select(models.Role).where(models.Role.id == id))
         role = result.one_or_none()
@@ -33,10 +38,7 @@ async def get_roles(
 
         raise HTTPException(status_code=404, detail=f"Pool {id} not found")
 
-    result = await session.scalars(select(models.Role))
-    roles = result.all()
-
-    return [RoleRead.model_validate(role, from_attributes=True) for role in roles]
+    return await paginate(session, select(models.Role), page, RoleRead)
 
 
 @role_router.post(
@@ -83,6 +85,9 @@ async def update_pool(
         setattr(role, k, v)
 
     await session.commit()
+    invalidate_role_permissions(id)
+    # cached users contain their roles
+    await user_cache.clear()
 
 
 @role_router.delete(
@@ -98,3 +103,6 @@ async def delete_pool(id: int, session: AsyncSession = Depends(async_get_db)):
 
     await session.delete(role)
     await session.commit()
+    invalidate_role_permissions(id)
+    # cached users contain their roles
+    await user_cache.clear()
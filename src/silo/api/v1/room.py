@@ -3,9 +3,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from silo.api.dependencies import require_permission
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
-from silo.schemas import RoomCreate, RoomRead
+from silo.utils import paginate
+from silo.schemas import CursorParams, Page, RoomCreate, RoomRead
 
 room_router = APIRouter(tags=["Room"], dependencies=[Depends(require_permission())])
 
@@ -13,7 +14,7 @@ room_router = APIRouter(tags=["Room"], dependencies=[Depends(require_permission(
 @room_router.get(
     "/room/",
     summary="Get all Rooms",
-    response_model=list[RoomRead],
+    response_model=list[RoomRead] | Page[RoomRead],
 )
 @room_router.get(
     "/room/{id}",
@@ -21,8 +22,10 @@ room_router = APIRouter(tags=["Room"], dependencies=[Depends(require_permission(
     response_model=RoomRead,
 )
 async def get_rooms(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> RoomRead | list[RoomRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> RoomRead | list[RoomRead] | Page[RoomRead]:
     if id is not None:
         result = await session.scalars(select(models.Room).where(models.Room.id == id))
         room = result.one_or_none()
@@ -32,10 +35,7 @@ async def get_rooms(
 
         raise HTTPException(status_code=404, detail=f"Room {id} not found")
 
-    result = await session.scalars(select(models.Room))
-    rooms = result.all()
-
-    return [RoomRead.model_validate(room, from_attributes=True) for room in rooms]
+    return await paginate(session, select(models.Room), page, RoomRead)
 
 
 @room_router.post(
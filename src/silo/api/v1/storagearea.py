@@ -1,21 +1,40 @@
-from fastapi import Depends, APIRouter, HTTPException
+from fastapi import Depends, APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from silo.api.dependencies import require_permission
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
-from silo.schemas import StorageAreaCreate, StorageAreaRead
+from silo.database.loaders import STORAGE_AREA_LOAD
+from silo.utils import ExportFormat, paginate, stream_export
+from silo.schemas import CursorParams, Page, StorageAreaCreate, StorageAreaRead
 
 storage_area_router = APIRouter(
     tags=["StorageArea"], dependencies=[Depends(require_permission())]
 )
 
 
+@storage_area_router.get(
+    "/storagearea/export",
+    summary="Export all StorageAreas",
+    response_class=StreamingResponse,
+)
+async def export_storage_areas(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+) -> StreamingResponse:
+    return stream_export(
+        select(models.StorageArea).options(*STORAGE_AREA_LOAD),
+        StorageAreaRead,
+        fmt,
+        filename="storageareas",
+    )
+
+
 @storage_area_router.get(
     "/storagearea/",
     summary="Get all StorageAreas",
-    response_model=list[StorageAreaRead],
+    response_model=list[StorageAreaRead] | Page[StorageAreaRead],
 )
 @storage_area_router.get(
     "/storagearea/{id}",
@@ -23,26 +42,25 @@ storage_area_router = APIRouter(
     response_model=StorageAreaRead,
 )
 async def get_storage_areas(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> StorageAreaRead | list[StorageAreaRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> StorageAreaRead | list[StorageAreaRead] | Page[StorageAreaRead]:
     if id is not None:
-        result = await session.scalars(
-            select(models.StorageArea).where(models.StorageArea.id == id)
+        storage_area = await session.get(
+            models.StorageArea, id, options=STORAGE_AREA_LOAD
         )
-        storage_area = result.one_or_none()
-
         if storage_area is not None:
             return StorageAreaRead.model_validate(storage_area)
 
         raise HTTPException(status_code=404, detail=f"StorageArea {id} not found")
 
-    result = await session.scalars(select(models.StorageArea))
-    storage_areas = result.all()
-
-    return [
-        StorageAreaRead.model_validate(storage_area, from_attributes=True)
-        for storage_area in storage_areas
-    ]
+    return await paginate(
+        session,
+        select(models.StorageArea).options(*STORAGE_AREA_LOAD),
+        page,
+        StorageAreaRead,
+    )
 
 
 @storage_area_router.post(
@@ -64,8 +82,13 @@ async def new_storage_area(
     )
     session.add(new_storage_area)
     await session.commit()
-    await session.refresh(new_storage_area)
-    return new_storage_area
+
+    return await session.get(
+        models.StorageArea,
+        new_storage_area.id,
+        options=STORAGE_AREA_LOAD,
+        populate_existing=True,
+    )
 
 
 @storage_area_router.put(
@@ -4,9 +4,12 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from silo.api.dependencies import require_permission
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
+from silo.utils import paginate
 from silo.schemas import (
+    CursorParams,
+    Page,
     StorageFurnitureCreate,
     StorageFurnitureRead,
     Response,
@@ -20,7 +23,7 @@ storage_furniture_router = APIRouter(
 @storage_furniture_router.get(
     "/storagefurniture/",
     summary="Get all StorageFurnitures",
-    response_model=list[StorageFurnitureRead],
+    response_model=list[StorageFurnitureRead] | Page[StorageFurnitureRead],
 )
 @storage_furniture_router.get(
     "/storagefurniture/{id}",
@@ -28,8 +31,10 @@ storage_furniture_router = APIRouter(
     response_model=StorageFurnitureRead,
 )
 async def get_storage_furnitures(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> StorageFurnitureRead | list[StorageFurnitureRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> StorageFurnitureRead | list[StorageFurnitureRead] | Page[StorageFurnitureRead]:
     if id is not None:
         result = await session.scalars(
             select(models.StorageFurniture).where(models.StorageFurniture.id == id)
@@ -41,13 +46,9 @@ async def get_storage_furnitures(
 
         raise HTTPException(status_code=404, detail=f"StorageFurniture {id} not found")
 
-    result = await session.scalars(select(models.StorageFurniture))
-    storage_furnitures = result.all()
-
-    return [
-        StorageFurnitureRead.model_validate(storage_furniture, from_attributes=True)
-        for storage_furniture in storage_furnitures
-    ]
+    return await paginate(
+        session, select(models.StorageFurniture), page, StorageFurnitureRead
+    )
 
 
 @storage_furniture_router.post(
@@ -3,9 +3,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from silo.api.dependencies import require_permission
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
-from silo.schemas import StorageTypeCreate, StorageTypeRead
+from silo.utils import paginate
+from silo.schemas import CursorParams, Page, StorageTypeCreate, StorageTypeRead
 
 storage_type_router = APIRouter(
     tags=["StorageType"], dependencies=[Depends(require_permission())]
@@ -15,7 +16,7 @@ storage_type_router = APIRouter(
 @storage_type_router.get(
     "/storagetype/",
     summary="Get all StorageTypes",
-    response_model=list[StorageTypeRead],
+    response_model=list[StorageTypeRead] | Page[StorageTypeRead],
 )
 @storage_type_router.get(
     "/storagetype/{id}",
@@ -23,8 +24,10 @@ storage_type_router = APIRouter(
     response_model=StorageTypeRead,
 )
 async def get_storage_types(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> StorageTypeRead | list[StorageTypeRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> StorageTypeRead | list[StorageTypeRead] | Page[StorageTypeRead]:
     if id is not None:
         result = await session.scalars(
             select(models.StorageType).where(models.StorageType.id == id)
@@ -36,13 +39,7 @@ async def get_storage_types(
 
         raise HTTPException(status_code=404, detail=f"StorageType {id} not found")
 
-    result = await session.scalars(select(models.StorageType))
-    storage_types = result.all()
-
-    return [
-        StorageTypeRead.model_validate(storage_type, from_attributes=True)
-        for storage_type in storage_types
-    ]
+    return await paginate(session, select(models.StorageType), page, StorageTypeRead)
 
 
 @storage_type_router.post(
@@ -3,9 +3,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from silo.api.dependencies import require_permission
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
-from silo.schemas import TagCreate, TagRead
+from silo.utils import paginate
+from silo.schemas import CursorParams, Page, TagCreate, TagRead
 
 tag_router = APIRouter(tags=["Tag"], dependencies=[Depends(require_permission())])
 
@@ -13,7 +14,7 @@ tag_router = APIRouter(tags=["Tag"], dependencies=[Depends(require_permission())
 @tag_router.get(
     "/tag/",
     summary="Get all Tags",
-    response_model=list[TagRead],
+    response_model=list[TagRead] | Page[TagRead],
 )
 @tag_router.get(
     "/tag/{id}",
@@ -21,8 +22,10 @@ tag_router = APIRouter(tags=["Tag"], dependencies=[Depends(require_permission())
     response_model=TagRead,
 )
 async def get_tags(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> TagRead | list[TagRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> TagRead | list[TagRead] | Page[TagRead]:
     if id is not None:
         result = await session.scalars(select(models.Tag).where(models.Tag.id == id))
         tag = result.one_or_none()
@@ -32,10 +35,7 @@ async def get_tags(
 
         raise HTTPException(status_code=404, detail=f"Tag {id} not found")
 
-    result = await session.scalars(select(models.Tag))
-    tags = result.all()
-
-    return [TagRead.model_validate(tag, from_attributes=True) for tag in tags]
+    return await paginate(session, select(models.Tag), page, TagRead)
 
 
 @tag_router.post(
@@ -1,21 +1,41 @@
-from fastapi import Depends, APIRouter, HTTPException
+from fastapi import Depends, APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
 
-from silo.database import async_get_db
+from silo.database import async_get_db, async_get_read_db
 from silo.database import models
-from silo.schemas import Response, UserCreate, UserRead, UserUpdate
+from silo.database.loaders import USER_LOAD
+from silo.utils import ExportFormat, paginate, stream_export
+from silo.schemas import CursorParams, Page, Response, UserCreate, UserRead, UserUpdate
 from silo.api.dependencies import get_current_user, require_permission
+from silo.security.sessions import revoke_user_sessions
+from silo.security.user_cache import user_cache
 
 user_router = APIRouter(tags=["User"], dependencies=[Depends(require_permission())])
 
 
+@user_router.get(
+    "/user/export",
+    summary="Export all Users",
+    response_class=StreamingResponse,
+)
+async def export_users(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+) -> StreamingResponse:
+    return stream_export(
+        select(models.User).options(*USER_LOAD),
+        UserRead,
+        fmt,
+        filename="users",
+    )
+
+
 @user_router.get(
     "/user/",
     summary="Get all Users",
-    response_model=list[UserRead],
+    response_model=list[UserRead] | Page[UserRead],
 )
 @user_router.get(
     "/user/{id}",
@@ -23,23 +43,23 @@ user_router = APIRouter(tags=["User"], dependencies=[Depends(require_permission(
     response_model=UserRead,
 )
 async def get_users(
-    session: AsyncSession = Depends(async_get_db), id: int | None = None
-) -> UserRead | list[UserRead]:
+    session: AsyncSession = Depends(async_get_read_db),
+    id: int | None = None,
+    page: CursorParams = Depends(),
+) -> UserRead | list[UserRead] | Page[UserRead]:
     if id is not None:
-        result = await session.scalars(select(models.User).where(models.User.id == id))
-        user = result.one_or_none()
-
+        user = await session.get(models.User, id, options=USER_LOAD)
         if user is not None:
             return UserRead.model_validate(user, from_attributes=True)
 
         raise HTTPException(status_code=404, detail=f"User {id} not found")
 
-    result = await session.scalars(
-        select(models.User).options(selectinload(models.User.roles))
+    return await paginate(
+        session,
+        select(models.User).options(*USER_LOAD),
+        page,
+        UserRead,
     )
-    users = result.all()
-
-    return [UserRead.model_validate(user, from_attributes=True) for user in users]
 
 
 @user_router.get("/myinfo", summary="Get my user information", response_model=UserRead)
@@ -86,9 +106,7 @@ async def assign_role(
     user_id: int, role_id: int, session: AsyncSession = Depends(async_get_db)
 ) -> UserRead:
     result_u = await session.execute(
-        select(models.User)
-        .options(selectinload(models.User.roles))
-        .where(models.User.id == user_id)
+        select(models.User).options(*USER_LOAD).where(models.User.id == user_id)
     )
     user: models.User | None = result_u.scalars().first()
     if user is None:
@@ -104,11 +122,10 @@ async def assign_role(
         user.roles.append(role)
 
     await session.commit()
+    await user_cache.invalidate(user_id)
 
     result = await session.execute(
-        select(models.User)
-        .options(selectinload(models.User.roles))
-        .where(models.User.id == user_id)
+        select(models.User).options(*USER_LOAD).where(models.User.id == user_id)
     )
     user = result.scalar_one()
 
@@ -134,6 +151,7 @@ async def update_user(
 
     await session.commit()
     await session.refresh(user)
+    await user_cache.invalidate(id)
 
 
 @user_router.delete(
@@ -149,3 +167,24 @@ async def delete_user(id: int, session: AsyncSession = Depends(async_get_db)):
 
     await session.delete(user)
     await session.commit()
+    await user_cache.invalidate(id)
+
+
+@user_router.post(
+    "/user/{id}/sessions/revoke",
+    summary="Revoke all sessions (refresh tokens) of a User",
+    response_model=Response,
+    responses={404: {"model": Response, "description": "Not found"}},
+)
+async def revoke_sessions(
+    id: int, session: AsyncSession = Depends(async_get_db)
+) -> Response:
+    user = await session.get(models.User, id)
+    if user is None:
+        raise HTTPException(404, detail="User not found")
+
+    revoked = await revoke_user_sessions(session, id)
+    await session.commit()
+    await user_cache.invalidate(id)
+
+    return Response(detail=f"{revoked} session(s) revoked")
@@ -1,23 +1,110 @@
 from collections.abc import AsyncGenerator
+from contextvars import ContextVar
+from itertools import cycle
+from time import time
 
+from fastapi import Request
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
 
 from silo import config
+from silo.database.pool import InstrumentedQueuePool, pool_status
+from silo.database.timing import QueryStats, instrument_engine, query_stats
 
 connection_string = f"{config.postgres_database_uri}"
 
+# cookie which routes reads of a client to the primary after it wrote something
+READ_YOUR_WRITES_COOKIE = "silo_rw"
+
+
+def engine_options() -> dict:
+    server_settings = {"application_name": config.app_name}
+    if config.db_statement_timeout is not None:
+        server_settings["statement_timeout"] = str(config.db_statement_timeout)
+
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": config.db_pool_size,
+        "max_overflow": config.db_max_overflow,
+        "pool_timeout": config.db_pool_timeout,
+        "pool_recycle": config.db_pool_recycle,
+        "pool_pre_ping": config.db_pool_pre_ping,
+        "connect_args": {
+            # asyncpg and SQLAlchemy both cache prepared statements
+            "statement_cache_size": config.db_statement_cache_size,
+            "prepared_statement_cache_size": config.db_statement_cache_size,
+            "command_timeout": config.db_command_timeout,
+            "server_settings": server_settings,
+        },
+    }
+
+
+class PrimarySession(Session):
+    pass
+
+
 async_engine = create_async_engine(
-    str(config.postgres_database_uri), echo=False, future=True
+    str(config.postgres_database_uri), echo=False, future=True, **engine_options()
 )
 local_session = async_sessionmaker(
-    bind=async_engine, class_=AsyncSession, expire_on_commit=False
+    bind=async_engine,
+    class_=AsyncSession,
+    sync_session_class=PrimarySession,
+    expire_on_commit=False,
 )
 
+replica_engines = [
+    create_async_engine(str(uri), echo=False, future=True, **engine_options())
+    for uri in config.postgres_replica_uris
+]
+replica_sessions = [
+    async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    for engine in replica_engines
+]
+_next_replica = cycle(replica_sessions)
+
+for engine in [async_engine, *replica_engines]:
+    instrument_engine(engine.sync_engine)
+
+# set per request by the middleware, flags that the request committed a write
+request_writes: ContextVar[dict | None] = ContextVar("request_writes", default=None)
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _mark_write(session: Session) -> None:
+    writes = request_writes.get()
+    if writes is not None:
+        writes["committed"] = True
+
+
+def read_your_writes_expiry() -> int:
+    return int(time()) + config.db_read_your_writes_seconds
+
+
+def recently_written(request: Request) -> bool:
+    try:
+        return int(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time()
+    except ValueError:
+        return False
+
+
+def read_session_factory(request: Request | None = None) -> async_sessionmaker:
+    if not replica_sessions or (request is not None and recently_written(request)):
+        return local_session
+    return next(_next_replica)
+
 
 async def async_get_db() -> AsyncGenerator[AsyncSession, None]:
     async with local_session() as db:
         yield db
+
+
+async def async_get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    # read-only handlers, uses a replica (if configured)
+    async with read_session_factory(request)() as db:
+        yield db
@@ -0,0 +1,17 @@
+from sqlalchemy.orm import joinedload, selectinload
+
+from silo.database import models
+
+# relationships are lazy="raise", every query loads what its schema serializes
+
+STORAGE_AREA_LOAD = (
+    joinedload(models.StorageArea.room),
+    joinedload(models.StorageArea.furniture),
+)
+
+ITEM_LOAD = (
+    joinedload(models.Item.storage_area).options(*STORAGE_AREA_LOAD),
+    selectinload(models.Item.tags),
+)
+
+USER_LOAD = (selectinload(models.User.roles),)
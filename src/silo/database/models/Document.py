@@ -1,4 +1,4 @@
-from sqlalchemy import Enum, ForeignKey
+from sqlalchemy import Enum, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import ENUM
 
@@ -37,3 +37,7 @@ class Document(Base, TimestampMixin):
         nullable=True,
         default=None,
     )
+    # SHA-256 of the file content (hex)
+    content_hash: Mapped[str | None] = mapped_column(
+        String(64), nullable=True, default=None
+    )
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey, UniqueConstraint, Enum
+from sqlalchemy import Computed, ForeignKey, UniqueConstraint, Enum
+from sqlalchemy.dialects.postgresql import TSVECTOR
 
 from silo.database.models import Base
 from silo.database.models.ItemTag import item_tag_association
@@ -11,6 +12,13 @@ from silo.schemas import BatteryType
 if TYPE_CHECKING:
     from silo.database.models import StorageArea, Tag
 
+# full text search document of an item (names and ids rank higher than descriptions)
+ITEM_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(silo_id, '') "
+    "|| ' ' || coalesce(serial_number, '') || ' ' || coalesce(inventory_number, '')), 'A') "
+    "|| setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
 
 class Item(Base, TimestampMixin):
     __tablename__ = "item"
@@ -38,14 +46,14 @@ class Item(Base, TimestampMixin):
         ForeignKey("storage_area.id"), nullable=False
     )
     storage_area: Mapped["StorageArea"] = relationship(
-        back_populates="items", lazy="selectin", init=False
+        back_populates="items", lazy="raise", init=False
     )
 
     tags: Mapped[list["Tag"]] = relationship(
         "Tag",
         secondary=item_tag_association,
         back_populates="items",
-        lazy="selectin",
+        lazy="raise",
         default_factory=list,
     )
 
@@ -60,6 +68,13 @@ class Item(Base, TimestampMixin):
     deleted: Mapped[bool] = mapped_column(default=False)
     inventory_number: Mapped[str | None] = mapped_column(default=None)
 
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(ITEM_SEARCH_VECTOR, persisted=True),
+        deferred=True,
+        init=False,
+    )
+
     __table_args__ = (
         UniqueConstraint("type_id", "pool_id", "sequence_num", name="silo_item_id"),
     )
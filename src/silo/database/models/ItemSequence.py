@@ -0,0 +1,18 @@
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from silo.database.models import Base
+
+
+class ItemSequence(Base):
+    """Last allocated SILO id sequence number per item type and pool"""
+
+    __tablename__ = "item_sequence"
+
+    type_id: Mapped[int] = mapped_column(
+        ForeignKey("item_type.id", ondelete="CASCADE"), primary_key=True
+    )
+    pool_id: Mapped[int] = mapped_column(
+        ForeignKey("pool.id", ondelete="CASCADE"), primary_key=True
+    )
+    last_value: Mapped[int] = mapped_column(default=0)
@@ -27,6 +27,6 @@ class Role(Base, TimestampMixin):
         secondary=user_roles_association,
         back_populates="roles",
         default_factory=list,
-        lazy="selectin",
+        lazy="raise",
     )
     permissions: Mapped[dict] = mapped_column(JSONB, default=dict)
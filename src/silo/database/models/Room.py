@@ -23,5 +23,5 @@ class Room(Base, TimestampMixin):
     description: Mapped[str]
 
     storage_areas: Mapped[list["StorageArea"]] = relationship(
-        back_populates="room", default_factory=list
+        back_populates="room", lazy="raise", default_factory=list
     )
@@ -1,11 +1,28 @@
 from datetime import datetime
-from pydantic import Field
 
-from silo.models import Base
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
 
+from silo.database.models import Base
+from silo.database.models.Base import TimestampMixin
 
-class Session(Base):
-    user_id: str
-    session_token: str
-    expires_at: datetime
-    created_at: datetime = Field(default_factory=datetime.now(datetime.timezone.utc))
+
+class Session(Base, TimestampMixin):
+    """Issued refresh tokens; every rotation adds a token to the family of the login"""
+
+    __tablename__ = "session"
+
+    jti: Mapped[str] = mapped_column(String(36), primary_key=True)
+    family_id: Mapped[str] = mapped_column(String(36), index=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), index=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    # the token was exchanged for a new one (using it again is a reuse)
+    rotated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None
+    )
+    # logout, reuse detection or revoked by an admin, applies to the whole family
+    revoked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None
+    )
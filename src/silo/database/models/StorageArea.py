@@ -25,14 +25,14 @@ class StorageArea(Base, TimestampMixin):
     )
 
     room: Mapped[Optional["Room"]] = relationship(
-        back_populates="storage_areas", lazy="selectin", default=None
+        back_populates="storage_areas", lazy="raise", default=None
     )
     furniture: Mapped[Optional["StorageFurniture"]] = relationship(
-        back_populates="storage_areas", lazy="selectin", default=None
+        back_populates="storage_areas", lazy="raise", default=None
     )
 
     items: Mapped[list["Item"]] = relationship(
-        back_populates="storage_area", lazy="selectin", default_factory=list
+        back_populates="storage_area", lazy="raise", default_factory=list
     )
 
     __table_args__ = (
@@ -29,7 +29,7 @@ class StorageFurniture(Base, TimestampMixin):
     )
 
     storage_areas: Mapped[list["StorageArea"]] = relationship(
-        back_populates="furniture", lazy="selectin", default_factory=list
+        back_populates="furniture", lazy="raise", default_factory=list
     )
 
     __table_args__ = (
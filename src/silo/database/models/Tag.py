@@ -28,5 +28,6 @@ class Tag(Base, TimestampMixin):
         "Item",
         secondary=item_tag_association,
         back_populates="tags",
+        lazy="raise",
         default_factory=list,
     )
@@ -30,7 +30,7 @@ class User(Base, TimestampMixin):
         back_populates="users",
         init=False,
         default_factory=list,
-        lazy="selectin",
+        lazy="raise",
     )
 
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -11,3 +11,5 @@ from .Role import Role
 from .Tag import Tag
 from .Comment import Comment
 from .Document import Document
+from .ItemSequence import ItemSequence
+from .Session import Session
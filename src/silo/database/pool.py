@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+@dataclass
+class PoolStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool which records how long checkouts wait for a free connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            waited = perf_counter() - start
+            self.stats.checkouts += 1
+            self.stats.wait_seconds_total += waited
+            self.stats.wait_seconds_max = max(self.stats.wait_seconds_max, waited)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+def pool_status(pool: InstrumentedQueuePool) -> dict:
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "checkouts": pool.stats.checkouts,
+        "timeouts": pool.stats.timeouts,
+        "wait_seconds_total": pool.stats.wait_seconds_total,
+        "wait_seconds_max": pool.stats.wait_seconds_max,
+    }
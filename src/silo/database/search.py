@@ -0,0 +1,50 @@
+import re
+
+from sqlalchemy import ColumnElement, Float, func, or_
+
+from silo.database import models
+from silo.database.models.Item import ITEM_SEARCH_VECTOR
+
+# create_all() does not alter existing tables, the statements are idempotent
+ITEM_SEARCH_DDL = [
+    "ALTER TABLE item ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    f"GENERATED ALWAYS AS ({ITEM_SEARCH_VECTOR}) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_item_search_vector ON item USING GIN (search_vector)",
+]
+
+# substring search on identifiers (requires the pg_trgm extension)
+ITEM_TRIGRAM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    *[
+        f"CREATE INDEX IF NOT EXISTS ix_item_{column}_trgm ON item "
+        f"USING GIN ({column} gin_trgm_ops)"
+        for column in ("silo_id", "serial_number", "inventory_number")
+    ],
+]
+
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def prefix_query(term: str) -> str | None:
+    # "eth cab" -> "eth:* & cab:*"
+    words = WORD_PATTERN.findall(term.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def item_search(term: str) -> tuple[ColumnElement[bool], ColumnElement[float] | None]:
+    conditions = [
+        models.Item.silo_id.icontains(term, autoescape=True),
+        models.Item.serial_number.icontains(term, autoescape=True),
+        models.Item.inventory_number.icontains(term, autoescape=True),
+    ]
+
+    rank = None
+    query = prefix_query(term)
+    if query is not None:
+        ts_query = func.to_tsquery("simple", query)
+        conditions.append(models.Item.search_vector.bool_op("@@")(ts_query))
+        rank = func.ts_rank_cd(models.Item.search_vector, ts_query, type_=Float)
+
+    return or_(*conditions), rank
@@ -0,0 +1,59 @@
+from fastapi import HTTPException
+from sqlalchemy import literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from silo.database import models
+
+# seeds the counters from existing items (create_all() does not fill new tables)
+ITEM_SEQUENCE_SEED = (
+    "INSERT INTO item_sequence (type_id, pool_id, last_value) "
+    "SELECT type_id, pool_id, max(sequence_num) FROM item GROUP BY type_id, pool_id "
+    "ON CONFLICT (type_id, pool_id) DO UPDATE "
+    "SET last_value = GREATEST(item_sequence.last_value, EXCLUDED.last_value)"
+)
+
+
+async def allocate_silo_ids(
+    session: AsyncSession, type_id: int, pool_id: int, count: int = 1
+) -> list[tuple[int, str]]:
+    """Reserves count sequence numbers and returns (sequence_num, silo_id) pairs
+
+    The counter row is incremented atomically, concurrent allocations for the same
+    type and pool wait for each other only until the allocating transaction ends.
+    """
+    type_name = (
+        select(models.ItemType.name)
+        .where(models.ItemType.id == type_id)
+        .scalar_subquery()
+    )
+    pool_name = (
+        select(models.Pool.name).where(models.Pool.id == pool_id).scalar_subquery()
+    )
+
+    # the names are read by the same statement, a rename is seen immediately
+    statement = (
+        insert(models.ItemSequence)
+        .from_select(
+            ["type_id", "pool_id", "last_value"],
+            select(models.ItemType.id, models.Pool.id, literal(count)).where(
+                models.ItemType.id == type_id, models.Pool.id == pool_id
+            ),
+        )
+        .on_conflict_do_update(
+            index_elements=["type_id", "pool_id"],
+            set_={"last_value": models.ItemSequence.last_value + count},
+        )
+        .returning(models.ItemSequence.last_value, type_name, pool_name)
+    )
+    row = (await session.execute(statement)).one_or_none()
+    if row is None:
+        raise HTTPException(
+            404, detail=f"ItemType {type_id} or Pool {pool_id} not found"
+        )
+    last_value, type_name, pool_name = row
+
+    return [
+        (sequence_num, f"{type_name}-{pool_name}-{sequence_num:04d}")
+        for sequence_num in range(last_value - count + 1, last_value + 1)
+    ]
@@ -0,0 +1,73 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from silo import config
+from silo.log import logger
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while handling a single request"""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: str | None = None
+
+    def add(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.total_seconds * 1000:.1f};desc="{self.count} queries", '
+            f"db-slowest;dur={self.slowest_seconds * 1000:.1f}"
+        )
+
+    def log_fields(self) -> dict:
+        return {
+            "db_queries": self.count,
+            "db_time_ms": round(self.total_seconds * 1000, 1),
+            "db_slowest_ms": round(self.slowest_seconds * 1000, 1),
+        }
+
+
+# set per request by the middleware
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._silo_query_start = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_silo_query_start", None)
+    if start is None:
+        return
+    seconds = perf_counter() - start
+
+    stats = query_stats.get()
+    if stats is not None:
+        stats.add(statement, seconds)
+
+    threshold = config.db_slow_query_threshold_ms
+    if threshold is not None and seconds * 1000 >= threshold:
+        # the parameters are not logged, they may contain personal data
+        logger.warning(
+            "Slow query (%.1f ms): %s",
+            seconds * 1000,
+            " ".join(statement.split()),
+            extra={"db_statement_ms": round(seconds * 1000, 1)},
+        )
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
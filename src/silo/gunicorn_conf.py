@@ -0,0 +1,16 @@
+# gunicorn settings, use with: gunicorn -c src/silo/gunicorn_conf.py ...
+# Loaded by the master from the file path: importing the silo package here
+# would set up the application (database engine, logging, keys) in the master
+# before the workers fork.
+import os
+
+try:
+    from prometheus_client import multiprocess
+except ImportError:
+    multiprocess = None
+
+
+def child_exit(server, worker):
+    # drops the live gauges of a stopped worker (silo.utils.metrics)
+    if multiprocess is not None and os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
@@ -1 +1 @@
-from .app_logging import logger, api_logger
+from .app_logging import logger, api_logger, queue_handler
@@ -1,9 +1,27 @@
-from logging import Formatter, getLogger, DEBUG, INFO, WARNING, ERROR, CRITICAL
+from logging import (
+    Filter,
+    Formatter,
+    LogRecord,
+    getLogger,
+    getHandlerByName,
+    DEBUG,
+    INFO,
+    WARNING,
+    ERROR,
+    CRITICAL,
+)
 from logging.config import dictConfig
-import inspect
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timezone
+from queue import Queue
+import atexit
+import copy
+import json
+import os
 from sys import stdout, exit
 
 from silo import config
+from silo.log.context import RequestContextFilter
 
 
 class CustomFormatter(Formatter):
@@ -22,37 +40,136 @@ class CustomFormatter(Formatter):
         CRITICAL: bold_red + format + reset,
     }
 
+    def __init__(self):
+        super().__init__()
+        # built once, not for every record
+        self.formatters = {
+            level: Formatter(log_fmt) for level, log_fmt in self.FORMATS.items()
+        }
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = Formatter(log_fmt)
+        formatter = self.formatters.get(record.levelno, self.formatters[INFO])
         return formatter.format(record)
 
 
+# attributes of every record, everything else was passed with extra={...}
+RECORD_ATTRIBUTES = set(vars(LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+}
+
+
+class JSONFormatter(Formatter):
+    """One JSON object per line, with the request context and extra fields"""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "message": record.getMessage(),
+        }
+        entry.update(
+            (key, value)
+            for key, value in vars(record).items()
+            if key not in RECORD_ATTRIBUTES
+        )
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+
+        return json.dumps(entry, default=str)
+
+
+exception_formatter = Formatter()
+
+
+class ProcessQueueHandler(QueueHandler):
+    """Queue handler with a listener thread per process. The thread is started
+    with the first record of a process: forked workers (gunicorn) inherit the
+    handler from the master, but not its thread."""
+
+    def __init__(self, queue: Queue):
+        super().__init__(queue)
+        self.pid: int | None = None
+
+    def start_listener(self) -> None:
+        # a new queue, the one of the parent may have been locked during fork
+        self.queue = Queue()
+        self.listener = QueueListener(
+            self.queue,
+            *self.listener.handlers,
+            respect_handler_level=self.listener.respect_handler_level,
+        )
+        self.listener.start()
+        self.pid = os.getpid()
+
+    def stop_listener(self) -> None:
+        # writes the queued records
+        if self.pid == os.getpid():
+            self.listener.stop()
+            self.pid = None
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        # the default folds the traceback into the message, the formatters of
+        # the listener get it as exc_text (the traceback is rendered here, the
+        # frames are not kept alive by the queue)
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record: LogRecord) -> None:
+        # called with the handler lock held
+        if self.pid != os.getpid():
+            self.start_listener()
+        super().emit(record)
+
+
 LOGGING_CONFIG = {
     "version": 1,
     "disable_existing_loggers": False,
     "formatters": {
         "default": {"format": "[%(levelname)s] (%(module)s) %(asctime)s - %(message)s"},
         "stdout_formatter": {"()": CustomFormatter},
+        "json": {"()": JSONFormatter},
+    },
+    "filters": {
+        "request_context": {"()": RequestContextFilter},
     },
     "handlers": {
         "stdout": {
             "class": "logging.StreamHandler",
             "stream": stdout,
-            "formatter": "stdout_formatter",
+            "formatter": "json" if config.log_format == "json" else "stdout_formatter",
             "level": config.log_level,
         },
         "file": {
             "class": "logging.handlers.RotatingFileHandler",
             "filename": config.log_directory + "/silo.log",
-            "formatter": "default",
+            "formatter": "json" if config.log_format == "json" else "default",
             "level": config.log_level,
             "mode": "a",
         },
+        # the event loop only enqueues the records, a background thread
+        # formats and writes them
+        "queue": {
+            "class": ProcessQueueHandler,
+            "handlers": ["file", "stdout"],
+            "respect_handler_level": True,
+            "filters": ["request_context"],
+        },
     },
     "loggers": {
         "silo": {
-            "handlers": ["file", "stdout"],
+            "handlers": ["queue"],
             "level": "DEBUG",
             "propagate": True,
         }
@@ -60,6 +177,9 @@ LOGGING_CONFIG = {
 }
 try:
     dictConfig(LOGGING_CONFIG)
+    queue_handler: ProcessQueueHandler = getHandlerByName("queue")
+    # flush the queue on exit
+    atexit.register(queue_handler.stop_listener)
     print(f"[APPLICATION LOGGING] Log file: {config.log_directory}/silo.log")
 except ValueError as e:
     print(f"[ERROR] Cannot configure application logging!!! {e}")
@@ -69,6 +189,18 @@ except ValueError as e:
 logger = getLogger("silo")
 
 
+class CallerFilter(Filter):
+    """Prefixes the message with the calling function (the endpoint)"""
+
+    def filter(self, record: LogRecord) -> bool:
+        record.msg = f"[{record.funcName}] {record.msg}"
+        return True
+
+
+_api_logger = getLogger("silo.api")
+_api_logger.addFilter(CallerFilter())
+
+
 def api_logger(message: str):
-    caller = inspect.stack()[1][3]
-    logger.info("[%s] %s", str(caller), message, stacklevel=2)
+    # stacklevel makes the logging module record the caller, no stack inspection
+    _api_logger.info(message, stacklevel=2)
@@ -0,0 +1,26 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+from logging import Filter, LogRecord
+
+
+@dataclass
+class RequestContext:
+    request_id: str
+    user_id: int | None = None
+
+
+# set per request by the middleware, the user is filled in by the authentication
+request_context: ContextVar[RequestContext | None] = ContextVar(
+    "request_context", default=None
+)
+
+
+class RequestContextFilter(Filter):
+    """Adds the request id and user id to the records. Runs in the context of
+    the caller, before the record is handed to the queue"""
+
+    def filter(self, record: LogRecord) -> bool:
+        context = request_context.get()
+        record.request_id = context.request_id if context is not None else None
+        record.user_id = context.user_id if context is not None else None
+        return True
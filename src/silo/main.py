@@ -1,14 +1,47 @@
+import asyncio
 import pathlib
-from fastapi import FastAPI, Request
+import re
+import secrets
+import uuid
+from time import perf_counter
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 
 from silo.api import router
 from silo import config
-from silo.log import logger
+from silo.log import logger, queue_handler
+from silo.log.context import RequestContext, request_context
+from silo.database import (
+    READ_YOUR_WRITES_COOKIE,
+    QueryStats,
+    async_engine,
+    query_stats,
+    read_your_writes_expiry,
+    replica_engines,
+    replica_sessions,
+    request_writes,
+)
 from silo.startup import create_tables, add_default_roles, add_default_admin
-from silo.security.authenticator_factory import create_authenticator
+from silo.security.authenticator_factory import get_authenticator
+from silo.security.jwt import key_ring
+from silo.security.sessions import (
+    load_revoked_sessions,
+    purge_expired_sessions,
+    refresh_revoked_sessions,
+)
+from silo.utils.metrics import (
+    metrics_available,
+    monitor_event_loop,
+    observe_request,
+    render_metrics,
+    route_template,
+    track_in_flight,
+)
+from silo.utils.storage_factory import document_storage
+from silo.utils.thumbnails import check_thumbnail_support, shutdown_executor
+from silo.utils.upload_limit import UploadSizeLimitMiddleware
 
 
 @asynccontextmanager
@@ -17,9 +50,9 @@ async def db_lifespan(app: FastAPI):
     logger.info(f"Starting application with log level: {config.log_level}")
     print(f"Starting application with log level: {config.log_level}")
 
-    # check authentication class configuration
-    create_authenticator()
-    # by calling create_authenticator an instance will be created and if the class is misconfigured a TypeError will be thrown
+    # build the authenticator of this worker
+    authenticator = get_authenticator()
+    # if the class is misconfigured a TypeError will be thrown
 
     # create database tables
     await create_tables()
@@ -30,10 +63,36 @@ async def db_lifespan(app: FastAPI):
     # initialize admin user
     await add_default_admin()
 
+    # refresh token sessions
+    await purge_expired_sessions()
+    await load_revoked_sessions()
+    revocation_task = asyncio.create_task(refresh_revoked_sessions())
+
+    check_thumbnail_support()
+
+    # event loop lag and database pool metrics
+    if config.metrics_enabled and not metrics_available:
+        logger.warning(
+            "[SILO] Metrics are enabled but prometheus_client is not installed "
+            "(install the 'metrics' extra)"
+        )
+    elif config.metrics_enabled and config.metrics_token is None:
+        logger.warning("[SILO] /metrics is served without authentication")
+    monitor_task = asyncio.create_task(
+        monitor_event_loop([async_engine, *replica_engines])
+    )
+
     logger.info("[SILO] Application startup complete")
 
     yield
 
+    revocation_task.cancel()
+    monitor_task.cancel()
+    shutdown_executor()
+    authenticator.close()
+    await document_storage.close()
+    queue_handler.stop_listener()
+
 
 app: FastAPI = FastAPI(
     title="SILO API",
@@ -70,18 +129,117 @@ app: FastAPI = FastAPI(
 
 app.include_router(router)
 
+
+@app.get(
+    "/.well-known/jwks.json",
+    summary="Public keys to verify the issued tokens (JWKS)",
+    tags=["auth"],
+)
+async def jwks(response: Response) -> dict:
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return key_ring.jwks()
+
+
+if config.metrics_enabled and metrics_available:
+
+    @app.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+    async def metrics(request: Request) -> Response:
+        # scrapers send the token as bearer token (Prometheus: authorization)
+        if config.metrics_token is not None:
+            expected = f"Bearer {config.metrics_token.get_secret_value()}"
+            given = request.headers.get("Authorization", "")
+            if not secrets.compare_digest(given.encode(), expected.encode()):
+                raise HTTPException(
+                    status_code=401,
+                    detail="Unauthorized",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+
+        data, content_type = render_metrics()
+        return Response(content=data, media_type=content_type)
+
+
 API_PREFIX = f"{router.prefix}/{config.api_version}"
 
 static_path = pathlib.Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=static_path), name="static")
 
 
+REQUEST_ID_HEADER = "X-Request-ID"
+REQUEST_ID_PATTERN = re.compile(r"[\w.:-]{1,128}")
+
+
+# inside the request middleware, rejected uploads are logged and counted
+app.add_middleware(
+    UploadSizeLimitMiddleware, max_file_size=config.document_max_file_size
+)
+
+
 # application middleware
 @app.middleware("http")
 async def http_auth_middleware(request: Request, call_next):
-    logger.info(f"Incoming request: {request.method} {request.url}")
+    # reuse the id of a proxy, so log lines can be correlated
+    request_id = request.headers.get(REQUEST_ID_HEADER, "")
+    if not REQUEST_ID_PATTERN.fullmatch(request_id):
+        request_id = uuid.uuid4().hex
+    request_context.set(RequestContext(request_id=request_id))
+
+    logger.debug(f"Incoming request: {request.method} {request.url}")
+
+    writes = {"committed": False}
+    request_writes.set(writes)
+
+    stats = QueryStats()
+    query_stats.set(stats)
+    start = perf_counter()
+
+    track_in_flight(1)
+    try:
+        response = await call_next(request)
+    except Exception:
+        observe_request(
+            request.method,
+            route_template(request.scope),
+            500,
+            perf_counter() - start,
+        )
+        raise
+    finally:
+        track_in_flight(-1)
+
+    duration = perf_counter() - start
+    observe_request(
+        request.method, route_template(request.scope), response.status_code, duration
+    )
+
+    duration_ms = duration * 1000
+    response.headers[REQUEST_ID_HEADER] = request_id
+    if config.db_server_timing:
+        response.headers.append(
+            "Server-Timing", f"{stats.server_timing()}, app;dur={duration_ms:.1f}"
+        )
+    logger.info(
+        f"Completed request: {request.method} {request.url.path} "
+        f"{response.status_code} in {duration_ms:.1f} ms, "
+        f"{stats.count} queries in {stats.total_seconds * 1000:.1f} ms",
+        extra={
+            "status_code": response.status_code,
+            "duration_ms": round(duration_ms, 1),
+            **stats.log_fields(),
+        },
+    )
+
+    # read-your-writes: route the next reads of this client to the primary
+    if writes["committed"] and replica_sessions:
+        response.set_cookie(
+            key=READ_YOUR_WRITES_COOKIE,
+            value=str(read_your_writes_expiry()),
+            httponly=True,
+            secure=True,
+            samesite="strict",
+            max_age=config.db_read_your_writes_seconds,
+        )
 
-    response = await call_next(request)
     return response
 
 
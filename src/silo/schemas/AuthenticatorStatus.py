@@ -0,0 +1,50 @@
+from pydantic import BaseModel, Field
+
+
+class AuthenticatorStatus(BaseModel):
+    max_workers: int = Field(description="Threads for directory calls")
+    calls: int = Field(description="Authentications since startup")
+    errors: int = Field(description="Authentications failed by the directory")
+    in_flight: int = Field(description="Authentications running or queued")
+    max_in_flight: int = Field()
+    latency_seconds_total: float = Field()
+    latency_seconds_max: float = Field()
+    queue_wait_seconds_total: float = Field(
+        description="Time spent waiting for a thread"
+    )
+    queue_wait_seconds_max: float = Field()
+
+    # connection pool of the LDAPAuthenticator
+    pool_size: int | None = None
+    pool_opened: int | None = None
+    pool_idle: int | None = None
+    pool_checkouts: int | None = None
+    pool_timeouts: int | None = None
+    pool_discarded: int | None = Field(
+        default=None, description="Connections closed after an error"
+    )
+    pool_wait_seconds_total: float | None = None
+    pool_wait_seconds_max: float | None = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "max_workers": 8,
+                "calls": 1520,
+                "errors": 2,
+                "in_flight": 1,
+                "max_in_flight": 6,
+                "latency_seconds_total": 95.12,
+                "latency_seconds_max": 1.204,
+                "queue_wait_seconds_total": 0.83,
+                "queue_wait_seconds_max": 0.152,
+                "pool_size": 4,
+                "pool_opened": 4,
+                "pool_idle": 3,
+                "pool_checkouts": 1520,
+                "pool_timeouts": 0,
+                "pool_discarded": 1,
+                "pool_wait_seconds_total": 0.412,
+                "pool_wait_seconds_max": 0.098,
+            }
+        }
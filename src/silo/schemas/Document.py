@@ -49,6 +49,7 @@ class DocumentBase(BaseModel):
     mime_type: DocumentMimeTypes
     document_type: DocumentType
     file_path: str = Field(max_length=500)
+    content_hash: str | None = Field(default=None, max_length=64)
 
 
 class DocumentCreate(DocumentBase):
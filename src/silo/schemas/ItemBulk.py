@@ -0,0 +1,78 @@
+from pydantic import BaseModel, Field, field_validator
+
+from .BatteryType import BatteryType
+from .Item import ItemRead
+from .ItemSearch import ItemFilter
+
+
+class ItemBulkError(BaseModel):
+    index: int = Field(description="Position of the element in the request")
+    detail: str = Field()
+
+
+class ItemBulkCreateResult(BaseModel):
+    created: list[ItemRead] = Field(default_factory=list)
+    errors: list[ItemBulkError] = Field(default_factory=list)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "created": [],
+                "errors": [{"index": 3, "detail": "StorageArea 32 not found"}],
+            }
+        }
+
+
+class ItemBulkChanges(BaseModel):
+    name: str | None = Field(default=None)
+    description: str | None = Field(default=None)
+    quantity: int | None = Field(default=None)
+    weight: int | None = Field(default=None)
+    serial_number: str | None = Field(default=None)
+    inventory_number: str | None = Field(default=None)
+    battery_type: BatteryType | None = Field(default=None)
+    storage_area_id: int | None = Field(default=None)
+
+    @field_validator("name", "description", "quantity", "storage_area_id")
+    @classmethod
+    def not_null(cls, value):
+        # optional to leave out, but the columns cannot be cleared
+        if value is None:
+            raise ValueError("must not be null")
+        return value
+
+
+class ItemBulkUpdate(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=10000)
+    changes: ItemBulkChanges
+
+    class Config:
+        json_schema_extra = {
+            "example": {"ids": [12, 13, 14], "changes": {"quantity": 0}},
+        }
+
+
+class ItemBulkMove(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=10000)
+    storage_area_id: int = Field()
+
+    class Config:
+        json_schema_extra = {
+            "example": {"ids": [12, 13, 14], "storage_area_id": 32},
+        }
+
+
+class ItemBulkDelete(BaseModel):
+    ids: list[int] | None = Field(default=None, min_length=1, max_length=10000)
+    filter: ItemFilter | None = Field(
+        default=None, description="Delete all Items matching the search filter"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {"filter": {"room_id": 4, "furniture_id": 2}},
+        }
+
+
+class ItemBulkResult(BaseModel):
+    affected: int = Field(description="Number of changed Items")
@@ -1,10 +1,24 @@
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
+from .Pagination import CursorParams
 
-class ItemSearch(BaseModel):
-    term: Optional[str] = Field(None, description="Search term for name or description")
+
+class ItemFilter(BaseModel):
+    term: Optional[str] = Field(
+        None,
+        description="Search term (prefix match on name, description and ids)",
+    )
     room_id: Optional[int] = Field(None, description="Filter by room")
     furniture_id: Optional[int] = Field(None, description="Filter by furniture")
-    limit: int = Field(50, ge=1, le=250, description="Maximum number of results")
-    offset: int = Field(0, ge=0, description="Skip results (pagination)")
+
+
+class ItemSearch(ItemFilter, CursorParams):
+    order_by: Literal["relevance", "id", "updated_at"] = Field(
+        "relevance",
+        description="Sort order, relevance only applies if a search term is given",
+    )
+    limit: int | None = Field(50, ge=1, le=250, description="Maximum number of results")
+    offset: int = Field(
+        0, ge=0, description="Skip results (pagination, ignored if a cursor is given)"
+    )
@@ -0,0 +1,34 @@
+from typing import Generic, Literal, TypeVar
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class CursorParams(BaseModel):
+    cursor: str | None = Field(
+        None,
+        description="Opaque cursor (next_cursor of the previous page), an empty cursor "
+        "requests the first page. Without a cursor a plain list is returned.",
+    )
+    limit: int | None = Field(
+        None,
+        ge=1,
+        le=250,
+        description="Maximum number of results (default 50 with a cursor, all without)",
+    )
+    order_by: Literal["id", "updated_at"] = Field(
+        "id",
+        description="Sort order: ascending by id or most recently updated first",
+    )
+
+    @property
+    def paged(self) -> bool:
+        # cursor pagination is opt-in, clients without a cursor get the plain list
+        return self.cursor is not None
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T] = Field(default_factory=list)
+    next_cursor: str | None = Field(
+        default=None, description="Cursor of the next page, null on the last page"
+    )
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+
+
+class PoolStatus(BaseModel):
+    size: int = Field(description="Configured pool size")
+    checked_in: int = Field(description="Idle connections")
+    checked_out: int = Field(description="Connections in use")
+    overflow: int = Field(description="Connections opened above the pool size")
+    max_overflow: int = Field()
+    checkouts: int = Field(description="Checkouts since startup")
+    timeouts: int = Field(description="Checkouts which timed out")
+    wait_seconds_total: float = Field(description="Time spent waiting for checkouts")
+    wait_seconds_max: float = Field(description="Longest checkout wait")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "size": 5,
+                "checked_in": 3,
+                "checked_out": 2,
+                "overflow": 0,
+                "max_overflow": 10,
+                "checkouts": 10452,
+                "timeouts": 0,
+                "wait_seconds_total": 1.283,
+                "wait_seconds_max": 0.041,
+            }
+        }
@@ -3,10 +3,13 @@ from .Token import Token
 from .Version import Version
 from .Response import Response
 from .AuthData import AuthData, UserAttributes
+from .Pagination import CursorParams, Page
+from .PoolStatus import PoolStatus
+from .AuthenticatorStatus import AuthenticatorStatus
 
 from .Item import ItemBase, ItemCreate, ItemRead
 from .ItemType import ItemTypeBase, ItemTypeCreate, ItemTypeRead
-from .ItemSearch import ItemSearch
+from .ItemSearch import ItemFilter, ItemSearch
 from .Room import RoomBase, RoomCreate, RoomRead
 from .Pool import PoolBase, PoolCreate, PoolRead
 from .User import UserBase, UserCreate, UserRead, UserUpdate
@@ -30,5 +33,16 @@ from .Document import (
     DocumentType,
 )
 
+from .ItemBulk import (
+    ItemBulkChanges,
+    ItemBulkCreateResult,
+    ItemBulkDelete,
+    ItemBulkError,
+    ItemBulkMove,
+    ItemBulkResult,
+    ItemBulkUpdate,
+)
+
 ItemRead.model_rebuild()
 TagRead.model_rebuild()
+ItemBulkCreateResult.model_rebuild()
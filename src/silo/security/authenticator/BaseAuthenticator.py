@@ -1,9 +1,45 @@
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
 
+from silo import config
 from silo.schemas import AuthData, UserAttributes
+from silo.utils.metrics import observe_authentication
+from silo.security.authenticator.exceptions import (
+    AuthenticationError,
+    AuthTimeoutError,
+    BindError,
+    BindNotAllowedError,
+)
+
+# failures of the directory itself (not of the user)
+DIRECTORY_ERRORS = (
+    AuthenticationError,
+    AuthTimeoutError,
+    BindError,
+    BindNotAllowedError,
+    TimeoutError,
+)
+
+
+@dataclass
+class AuthenticatorStats:
+    calls: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    latency_seconds_total: float = 0.0
+    latency_seconds_max: float = 0.0
+    queue_wait_seconds_total: float = 0.0
+    queue_wait_seconds_max: float = 0.0
 
 
 class BaseAuthenticator(ABC):
+    _executor: ThreadPoolExecutor | None = None
+    _stats: AuthenticatorStats | None = None
+
     @abstractmethod
     def authenticate(self, **kwargs: AuthData) -> bool:
         pass
@@ -11,3 +47,64 @@ class BaseAuthenticator(ABC):
     @abstractmethod
     def get_user_attributes(self) -> UserAttributes:
         pass
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        # blocking directory calls run on a bounded thread pool, off the event loop
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=config.authenticator_max_workers,
+                thread_name_prefix="silo-auth",
+            )
+
+        return self._executor
+
+    @property
+    def stats(self) -> AuthenticatorStats:
+        if self._stats is None:
+            self._stats = AuthenticatorStats()
+
+        return self._stats
+
+    async def async_authenticate(self, **kwargs: AuthData) -> bool | UserAttributes:
+        stats = self.stats
+        timing = {"submitted": perf_counter()}
+
+        def run():
+            timing["started"] = perf_counter()
+            return self.authenticate(**kwargs)
+
+        stats.calls += 1
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        error = False
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, run)
+        except DIRECTORY_ERRORS:
+            stats.errors += 1
+            error = True
+            raise
+        finally:
+            stats.in_flight -= 1
+            finished = perf_counter()
+            started = timing.get("started", finished)
+
+            queue_wait = started - timing["submitted"]
+            stats.queue_wait_seconds_total += queue_wait
+            stats.queue_wait_seconds_max = max(stats.queue_wait_seconds_max, queue_wait)
+
+            latency = finished - started
+            stats.latency_seconds_total += latency
+            stats.latency_seconds_max = max(stats.latency_seconds_max, latency)
+            observe_authentication(latency, queue_wait, error)
+
+    def status(self) -> dict:
+        return {
+            "max_workers": config.authenticator_max_workers,
+            **vars(self.stats),
+        }
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
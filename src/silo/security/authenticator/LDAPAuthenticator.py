@@ -1,5 +1,6 @@
 from ssl import CERT_NONE
-from ldap3 import Connection, Server, Tls, ALL
+import threading
+from ldap3 import Connection, Server, Tls, NONE
 from ldap3.utils.conv import escape_filter_chars
 from ldap3.core.exceptions import (
     LDAPSocketOpenError,
@@ -13,7 +14,9 @@ from ldap3.core.exceptions import (
 from silo import config
 from silo.log import logger
 from silo.schemas import AuthData, UserAttributes
+from silo.utils import TTLCache
 from silo.security.authenticator import BaseAuthenticator
+from silo.security.authenticator.ldap_pool import CONNECTION_ERRORS, LDAPConnectionPool
 from silo.security.authenticator.exceptions import (
     AuthTimeoutError,
     BindError,
@@ -35,6 +38,10 @@ class LDAPAuthenticator(BaseAuthenticator):
         allowed_groups: list[str],
         use_ssl: bool,
         ssl_skip_verify: bool,
+        pool_size: int = 4,
+        pool_timeout: float = 10,
+        attribute_cache_ttl: int = 0,
+        attribute_cache_max_size: int = 1024,
     ):
         self.server_uri = server_uri
         self.base_dn = base_dn
@@ -54,7 +61,30 @@ class LDAPAuthenticator(BaseAuthenticator):
             use_ssl=self.use_ssl,
             tls=tls,
             connect_timeout=config.ldap_connect_timeout,
-            get_info=ALL,
+            # the server schema/info is not used, fetching it costs a round trip per connection
+            get_info=NONE,
+        )
+
+        # user attributes and group membership, shared by the authenticator threads
+        self.attribute_cache: TTLCache[str, UserAttributes] = TTLCache(
+            attribute_cache_max_size, attribute_cache_ttl
+        )
+        self.attribute_cache_lock = threading.Lock()
+
+        # service account connections, reused for the user searches
+        self.pool = LDAPConnectionPool(
+            self._service_connection, size=pool_size, timeout=pool_timeout
+        )
+
+    def _service_connection(self) -> Connection:
+        # anonymous bind if no bind user is given
+        return Connection(
+            self.server,
+            user=self.bind_dn,
+            password=self.bind_pw,
+            receive_timeout=config.ldap_receive_timeout,
+            raise_exceptions=True,
+            auto_bind=True,
         )
 
     def authenticate(
@@ -112,16 +142,7 @@ class LDAPAuthenticator(BaseAuthenticator):
 
         return False
 
-    def get_user_attributes(self, username) -> UserAttributes:
-        # use a bind user to fetch user attributes (anonymous bind if no one given)
-        connection = Connection(
-            self.server,
-            user=config.ldap_bind_dn,
-            password=config.ldap_bind_pw,
-            raise_exceptions=True,
-            auto_bind=True,
-        )
-
+    def _search_user(self, username):
         search_attributes = [
             config.ldap_username_attribute,
             config.ldap_mail_attribute,
@@ -131,22 +152,48 @@ class LDAPAuthenticator(BaseAuthenticator):
 
         escaped_username = escape_filter_chars(username, "utf-8")
 
-        connection.search(
-            search_base=config.ldap_base_user_dn
-            if config.ldap_base_user_dn is not None
-            else config.ldap_base_dn,
-            search_filter=config.ldap_user_search_filter.format(
-                username=escaped_username
-            ),
-            attributes=search_attributes,
-        )
+        with self.pool.connection() as connection:
+            connection.search(
+                search_base=config.ldap_base_user_dn
+                if config.ldap_base_user_dn is not None
+                else config.ldap_base_dn,
+                search_filter=config.ldap_user_search_filter.format(
+                    username=escaped_username
+                ),
+                attributes=search_attributes,
+            )
 
-        if not connection.entries:
-            connection.unbind()
-            raise UserNotFound()
+            return connection.entries[0] if connection.entries else None
 
-        entry = connection.entries[0]
-        connection.unbind()
+    def status(self) -> dict:
+        return {**super().status(), **self.pool.status()}
+
+    def close(self) -> None:
+        super().close()
+        self.pool.close()
+        self.attribute_cache.clear()
+
+    def get_user_attributes(self, username) -> UserAttributes:
+        with self.attribute_cache_lock:
+            user_data = self.attribute_cache.get(username)
+        if user_data is not None:
+            return user_data
+
+        user_data = self._fetch_user_attributes(username)
+        with self.attribute_cache_lock:
+            self.attribute_cache.set(username, user_data)
+
+        return user_data
+
+    def _fetch_user_attributes(self, username) -> UserAttributes:
+        try:
+            entry = self._search_user(username)
+        except CONNECTION_ERRORS:
+            # a pooled connection may have been closed by the server meanwhile
+            entry = self._search_user(username)
+
+        if entry is None:
+            raise UserNotFound()
 
         groups = entry[config.ldap_groups_attribute].value
         if not isinstance(groups, list):
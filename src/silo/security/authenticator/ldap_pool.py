@@ -0,0 +1,116 @@
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from queue import Empty, LifoQueue
+from time import perf_counter
+
+from ldap3 import Connection
+from ldap3.core.exceptions import LDAPCommunicationError, LDAPResponseTimeoutError
+
+from silo.security.authenticator.exceptions import AuthTimeoutError
+
+# the connection is unusable after these
+CONNECTION_ERRORS = (LDAPCommunicationError, LDAPResponseTimeoutError)
+
+
+@dataclass
+class LDAPPoolStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    discarded: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
+class LDAPConnectionPool:
+    """Bound service account connections, shared by the authenticator threads"""
+
+    def __init__(self, connect: Callable[[], Connection], size: int, timeout: float):
+        self.connect = connect
+        self.size = size
+        self.timeout = timeout
+
+        self.idle: LifoQueue[Connection] = LifoQueue()
+        self.lock = threading.Lock()
+        self.opened = 0
+        self.stats = LDAPPoolStats()
+
+    def _checkout(self) -> Connection:
+        try:
+            return self.idle.get_nowait()
+        except Empty:
+            pass
+
+        with self.lock:
+            can_open = self.opened < self.size
+            if can_open:
+                self.opened += 1
+
+        if can_open:
+            try:
+                return self.connect()
+            except BaseException:
+                with self.lock:
+                    self.opened -= 1
+                raise
+
+        try:
+            return self.idle.get(timeout=self.timeout)
+        except Empty:
+            with self.lock:
+                self.stats.timeouts += 1
+            raise AuthTimeoutError("No free LDAP connection in the pool")
+
+    def _discard(self, connection: Connection) -> None:
+        with self.lock:
+            self.opened -= 1
+            self.stats.discarded += 1
+        try:
+            connection.unbind()
+        except Exception:
+            pass
+
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        start = perf_counter()
+        connection = self._checkout()
+        waited = perf_counter() - start
+        with self.lock:
+            self.stats.checkouts += 1
+            self.stats.wait_seconds_total += waited
+            self.stats.wait_seconds_max = max(self.stats.wait_seconds_max, waited)
+
+        try:
+            # closed by the server or after an error, bind() opens it again
+            if not connection.bound:
+                connection.bind()
+            yield connection
+        except CONNECTION_ERRORS:
+            self._discard(connection)
+            raise
+        except BaseException:
+            self.idle.put(connection)
+            raise
+        else:
+            self.idle.put(connection)
+
+    def status(self) -> dict:
+        return {
+            "pool_size": self.size,
+            "pool_opened": self.opened,
+            "pool_idle": self.idle.qsize(),
+            "pool_checkouts": self.stats.checkouts,
+            "pool_timeouts": self.stats.timeouts,
+            "pool_discarded": self.stats.discarded,
+            "pool_wait_seconds_total": self.stats.wait_seconds_total,
+            "pool_wait_seconds_max": self.stats.wait_seconds_max,
+        }
+
+    def close(self) -> None:
+        while True:
+            try:
+                connection = self.idle.get_nowait()
+            except Empty:
+                break
+            self._discard(connection)
@@ -1,3 +1,5 @@
+from functools import cache
+
 from silo import config
 from silo.utils import load_class_from_string
 from silo.security import authenticator
@@ -21,7 +23,18 @@ def create_authenticator() -> authenticator.BaseAuthenticator:
                 ssl_skip_verify=config.ldap_ssl_skip_verify,
                 bind_dn=config.ldap_bind_dn,
                 bind_pw=config.ldap_bind_pw,
+                pool_size=config.ldap_pool_size,
+                pool_timeout=config.ldap_pool_timeout,
+                attribute_cache_ttl=config.ldap_attribute_cache_ttl,
+                attribute_cache_max_size=config.ldap_attribute_cache_max_size,
             )
 
         case _:
             return auth_class()
+
+
+# one instance per worker process, built at startup (db_lifespan); it owns the
+# thread and connection pools and the attribute cache
+@cache
+def get_authenticator() -> authenticator.BaseAuthenticator:
+    return create_authenticator()
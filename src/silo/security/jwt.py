@@ -1,38 +1,183 @@
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Any
 from fastapi import HTTPException
 from fastapi.security import OAuth2PasswordBearer
 import jwt
-from jwt.exceptions import PyJWTError
+from jwt.algorithms import has_crypto
+from jwt.exceptions import InvalidKeyError, PyJWTError
 
 from silo import config
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
+# algorithm of additional verification keys, by JWK key type / curve
+KEY_ALGORITHMS = {
+    "RSA": "RS256",
+    "Ed25519": "EdDSA",
+    "Ed448": "EdDSA",
+    "P-256": "ES256",
+    "P-384": "ES384",
+    "P-521": "ES512",
+}
 
-def create_access_token(sub: str) -> str:
+
+@dataclass(frozen=True)
+class JWTKey:
+    kid: str | None
+    algorithm: str
+    # parsed once: key object or the HMAC secret
+    key: Any
+    jwk: dict | None = None  # public keys only
+
+
+def _thumbprint(jwk: dict) -> str:
+    # RFC 7638
+    members = {
+        name: jwk[name] for name in ("crv", "e", "kty", "n", "x", "y") if name in jwk
+    }
+    digest = hashlib.sha256(json.dumps(members, separators=(",", ":")).encode())
+    return base64.urlsafe_b64encode(digest.digest()).rstrip(b"=").decode()
+
+
+def _public_jwk(public_key: Any) -> dict:
+    from cryptography.hazmat.primitives.asymmetric import ec, ed448, ed25519, rsa
+    from jwt.algorithms import ECAlgorithm, OKPAlgorithm, RSAAlgorithm
+
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return RSAAlgorithm.to_jwk(public_key, as_dict=True)
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        return ECAlgorithm.to_jwk(public_key, as_dict=True)
+    if isinstance(public_key, (ed25519.Ed25519PublicKey, ed448.Ed448PublicKey)):
+        return OKPAlgorithm.to_jwk(public_key, as_dict=True)
+
+    raise ValueError(f"[SILO] Unsupported JWT key type {type(public_key).__name__}")
+
+
+def _load_key(
+    path: str, algorithm: str | None = None, kid: str | None = None
+) -> tuple[Any, JWTKey]:
+    """Returns the key object of the PEM file and its public verification key"""
+    if not has_crypto:
+        raise ValueError(
+            "[SILO] Asymmetric JWT keys need the cryptography package (pyjwt[crypto])"
+        )
+    from cryptography.hazmat.primitives.serialization import (
+        load_pem_private_key,
+        load_pem_public_key,
+    )
+
+    pem = Path(path).read_bytes()
+    try:
+        key = load_pem_private_key(pem, password=None)
+        public_key = key.public_key()
+    except ValueError:
+        key = public_key = load_pem_public_key(pem)
+
+    jwk = _public_jwk(public_key)
+    if algorithm is None:
+        algorithm = KEY_ALGORITHMS[jwk.get("crv", jwk["kty"])]
+    kid = kid or _thumbprint(jwk)
+
+    return key, JWTKey(
+        kid=kid,
+        algorithm=algorithm,
+        key=public_key,
+        jwk={**jwk, "kid": kid, "alg": algorithm, "use": "sig"},
+    )
+
+
+class KeyRing:
+    """The signing key and all keys accepted for verification (rotation), by kid"""
+
+    def __init__(self, signing_key: JWTKey, verification_keys: list[JWTKey]):
+        self.signing_key = signing_key
+        self.verification_keys = {key.kid: key for key in verification_keys}
+
+    @classmethod
+    def from_config(cls) -> "KeyRing":
+        algorithm = config.jwt_algorithm
+
+        if algorithm.startswith("HS"):
+            if config.jwt_secret_key is None:
+                raise ValueError(f"[SILO] {algorithm} needs SILO_JWT_SECRET_KEY")
+            signing_key = JWTKey(
+                kid=config.jwt_key_id,
+                algorithm=algorithm,
+                key=config.jwt_secret_key.get_secret_value().encode(),
+            )
+            verification_keys = [signing_key]
+        else:
+            if config.jwt_private_key_file is None:
+                raise ValueError(f"[SILO] {algorithm} needs SILO_JWT_PRIVATE_KEY_FILE")
+            private_key, public_key = _load_key(
+                config.jwt_private_key_file, algorithm, config.jwt_key_id
+            )
+            signing_key = JWTKey(
+                kid=public_key.kid, algorithm=algorithm, key=private_key
+            )
+            verification_keys = [public_key]
+
+        # previous (or upcoming) public keys, tokens signed with them stay valid
+        for path in config.jwt_verification_key_files:
+            verification_keys.append(_load_key(path)[1])
+
+        return cls(signing_key, verification_keys)
+
+    def encode(self, payload: dict) -> str:
+        headers = {"kid": self.signing_key.kid} if self.signing_key.kid else None
+        return jwt.encode(
+            payload,
+            self.signing_key.key,
+            algorithm=self.signing_key.algorithm,
+            headers=headers,
+        )
+
+    def decode(self, token: str) -> dict:
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self.verification_keys.get(kid)
+        if key is None:
+            raise InvalidKeyError(f"Unknown key id {kid}")
+
+        return jwt.decode(token, key.key, algorithms=[key.algorithm])
+
+    def jwks(self) -> dict:
+        return {
+            "keys": [
+                key.jwk
+                for key in self.verification_keys.values()
+                if key.jwk is not None
+            ]
+        }
+
+
+key_ring = KeyRing.from_config()
+
+
+def create_access_token(sub: str, sid: str | None = None) -> str:
     payload = {
         "sub": sub,
         "type": "access",
+        # session (refresh token family) the token was issued for
+        "sid": sid,
         "exp": datetime.now(timezone.utc)
         + timedelta(minutes=config.jwt_access_token_expire_minutes),
         "iat": datetime.now(timezone.utc),
     }
-    return jwt.encode(
-        payload, str(config.jwt_secret_key), algorithm=config.jwt_algorithm
-    )
+    return key_ring.encode(payload)
 
 
 def decode_token(token: str) -> dict:
-    return jwt.decode(
-        token, str(config.jwt_secret_key), algorithms=[config.jwt_algorithm]
-    )
+    return key_ring.decode(token)
 
 
 async def verify_token(token: str) -> dict:
     try:
-        payload = jwt.decode(
-            token, str(config.jwt_secret_key), algorithms=[config.jwt_algorithm]
-        )
+        payload = key_ring.decode(token)
         user_id: str = payload.get("sub")
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
@@ -50,14 +195,15 @@ async def verify_token(token: str) -> dict:
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
-def create_refresh_token(sub: str) -> str:
+def create_refresh_token(
+    sub: str, jti: str, family_id: str, expires_at: datetime
+) -> str:
     payload = {
         "sub": sub,
         "type": "refresh",
-        "exp": datetime.now(timezone.utc)
-        + timedelta(days=config.jwt_refresh_token_expire_days),
+        "jti": jti,
+        "fam": family_id,
+        "exp": expires_at,
         "iat": datetime.now(timezone.utc),
     }
-    return jwt.encode(
-        payload, str(config.jwt_secret_key), algorithm=config.jwt_algorithm
-    )
+    return key_ring.encode(payload)
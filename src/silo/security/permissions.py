@@ -0,0 +1,51 @@
+import re
+from fnmatch import translate
+from typing import Iterable
+
+from silo.schemas import RoleRead
+
+
+class PermissionMatcher:
+    """Role permissions ({pattern: [methods]}) compiled to one regex per method"""
+
+    def __init__(self, permissions: dict[str, list[str]] | None):
+        patterns: dict[str, list[str]] = {}
+        for pattern, methods in (permissions or {}).items():
+            for method in methods:
+                patterns.setdefault(method, []).append(translate(pattern))
+
+        self.rules = {
+            method: re.compile(
+                "|".join(f"(?:{pattern})" for pattern in method_patterns)
+            )
+            for method, method_patterns in patterns.items()
+        }
+
+    def allows(self, method: str, path: str) -> bool:
+        rule = self.rules.get(method)
+        return rule is not None and rule.match(path) is not None
+
+
+# role id -> (updated_at of the compiled permissions, matcher)
+_role_matchers: dict[int, tuple[object, PermissionMatcher]] = {}
+
+
+def role_matcher(role: RoleRead) -> PermissionMatcher:
+    cached = _role_matchers.get(role.id)
+    if cached is not None and cached[0] == role.updated_at:
+        return cached[1]
+
+    matcher = PermissionMatcher(role.permissions)
+    _role_matchers[role.id] = (role.updated_at, matcher)
+    return matcher
+
+
+def is_allowed(roles: Iterable[RoleRead], method: str, path: str) -> bool:
+    return any(role_matcher(role).allows(method, path) for role in roles)
+
+
+def invalidate_role_permissions(role_id: int | None = None) -> None:
+    if role_id is None:
+        _role_matchers.clear()
+    else:
+        _role_matchers.pop(role_id, None)
@@ -0,0 +1,126 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from time import monotonic
+
+from silo import config
+from silo.utils import TTLCache, load_class_from_string
+
+
+class BaseRateLimiter(ABC):
+    """Login attempts per username and per client IP (sliding window), plus an
+    exponential backoff after failed authentications per username and IP"""
+
+    def __init__(
+        self,
+        window: int,
+        username_limit: int,
+        ip_limit: int,
+        backoff_base: float,
+        backoff_max: float,
+        max_keys: int,
+    ):
+        self.window = window
+        self.username_limit = username_limit
+        self.ip_limit = ip_limit
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_keys = max_keys
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int) -> float:
+        """Register an attempt, returns the seconds to wait if the limit is reached"""
+
+    @abstractmethod
+    async def blocked(self, key: str) -> float:
+        """Seconds left of the backoff"""
+
+    @abstractmethod
+    async def add_failure(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def reset(self, key: str) -> None:
+        pass
+
+    def backoff(self, failures: int) -> float:
+        return min(self.backoff_base * 2 ** (failures - 1), self.backoff_max)
+
+    async def check_login(self, username: str, ip: str) -> float:
+        retry_after = await self.blocked(self.failure_key(username, ip))
+        if retry_after > 0:
+            return retry_after
+
+        for key, limit in (
+            (f"user:{username.lower()}", self.username_limit),
+            (f"ip:{ip}", self.ip_limit),
+        ):
+            retry_after = await self.hit(key, limit)
+            if retry_after > 0:
+                return retry_after
+
+        return 0
+
+    def failure_key(self, username: str, ip: str) -> str:
+        return f"failures:{username.lower()}:{ip}"
+
+
+class MemoryRateLimiter(BaseRateLimiter):
+    """Per worker process limiter, the limits apply to each worker separately"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.attempts: TTLCache[str, deque[float]] = TTLCache(
+            self.max_keys, self.window
+        )
+        # failure count and end of the backoff
+        self.failures: TTLCache[str, tuple[int, float]] = TTLCache(
+            self.max_keys, self.backoff_max + self.window
+        )
+
+    async def hit(self, key: str, limit: int) -> float:
+        if limit <= 0:
+            return 0
+
+        now = monotonic()
+        attempts = self.attempts.get(key)
+        if attempts is None:
+            attempts = deque(maxlen=limit)
+
+        # the oldest of the last <limit> attempts has to be outside of the window
+        if len(attempts) == limit and attempts[0] > now - self.window:
+            return attempts[0] + self.window - now
+
+        attempts.append(now)
+        self.attempts.set(key, attempts)
+        return 0
+
+    async def blocked(self, key: str) -> float:
+        _, blocked_until = self.failures.get(key, (0, 0.0))
+        return max(blocked_until - monotonic(), 0)
+
+    async def add_failure(self, key: str) -> None:
+        failures, _ = self.failures.get(key, (0, 0.0))
+        failures += 1
+        self.failures.set(key, (failures, monotonic() + self.backoff(failures)))
+
+    async def reset(self, key: str) -> None:
+        self.failures.pop(key)
+
+
+def create_rate_limiter() -> BaseRateLimiter:
+    if isinstance(config.login_rate_limiter_class, str):
+        limiter_class = load_class_from_string(config.login_rate_limiter_class)
+    else:
+        limiter_class = config.login_rate_limiter_class
+
+    return limiter_class(
+        window=config.login_rate_limit_window,
+        username_limit=config.login_rate_limit_username,
+        ip_limit=config.login_rate_limit_ip,
+        backoff_base=config.login_backoff_base,
+        backoff_max=config.login_backoff_max,
+        max_keys=config.login_rate_limit_max_keys,
+    )
+
+
+login_rate_limiter = create_rate_limiter()
@@ -0,0 +1,216 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from silo import config
+from silo.database import PrimarySession, local_session, models
+from silo.log import logger
+from silo.security.jwt import create_refresh_token
+
+# family ids revoked in a transaction, published to the cache on commit
+PENDING_REVOCATIONS = "silo_revoked_sessions"
+
+
+class InvalidSessionError(Exception):
+    pass
+
+
+class RevocationCache:
+    """Revoked sessions (refresh token families) of all workers, checked for
+    every access token"""
+
+    def __init__(self):
+        self.revoked: set[str] = set()
+
+    def add(self, family_id: str) -> None:
+        self.revoked.add(family_id)
+
+    def replace(self, family_ids: set[str]) -> None:
+        self.revoked = family_ids
+
+    def __contains__(self, family_id: str) -> bool:
+        return family_id in self.revoked
+
+
+revoked_sessions = RevocationCache()
+
+
+def _revoke_on_commit(db: AsyncSession, family_ids: set[str]) -> None:
+    db.info.setdefault(PENDING_REVOCATIONS, set()).update(family_ids)
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _publish_revocations(session: Session) -> None:
+    for family_id in session.info.pop(PENDING_REVOCATIONS, ()):
+        revoked_sessions.add(family_id)
+
+
+@event.listens_for(PrimarySession, "after_soft_rollback")
+def _discard_revocations(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(PENDING_REVOCATIONS, None)
+
+
+def _issue(user_id: int, family_id: str) -> tuple[str, models.Session]:
+    jti = str(uuid.uuid4())
+    expires_at = datetime.now(timezone.utc) + timedelta(
+        days=config.jwt_refresh_token_expire_days
+    )
+    token = create_refresh_token(str(user_id), jti, family_id, expires_at)
+    return token, models.Session(
+        jti=jti, family_id=family_id, user_id=user_id, expires_at=expires_at
+    )
+
+
+def create_session(db: AsyncSession, user_id: int) -> tuple[str, str]:
+    """New login, returns the refresh token and the session (family) id"""
+    family_id = str(uuid.uuid4())
+    token, session = _issue(user_id, family_id)
+    db.add(session)
+
+    return token, family_id
+
+
+async def _concurrent_refresh(
+    db: AsyncSession, session: models.Session, now: datetime
+) -> bool:
+    """The token was exchanged just now and the token it was exchanged for is
+    still unused: a concurrent refresh rather than a stolen copy"""
+    if (
+        session.rotated_at is None
+        or session.revoked_at is not None
+        or session.expires_at <= now
+        or now - session.rotated_at
+        > timedelta(seconds=config.session_reuse_grace_seconds)
+    ):
+        return False
+
+    # only the immediately preceding token, not one of an earlier rotation
+    newer = await db.scalar(
+        select(models.Session.jti)
+        .where(
+            models.Session.family_id == session.family_id,
+            models.Session.rotated_at > session.rotated_at,
+        )
+        .limit(1)
+    )
+    return newer is None
+
+
+async def rotate_session(db: AsyncSession, payload: dict) -> tuple[str, str, int]:
+    """Exchange a refresh token, returns the new token, the session id and the user id"""
+    jti = payload.get("jti")
+    if not jti:
+        raise InvalidSessionError("Refresh token without id")
+
+    now = datetime.now(timezone.utc)
+    # atomic, a token can only be rotated once
+    result = await db.execute(
+        update(models.Session)
+        .where(
+            models.Session.jti == jti,
+            models.Session.rotated_at.is_(None),
+            models.Session.revoked_at.is_(None),
+            models.Session.expires_at > now,
+        )
+        .values(rotated_at=now)
+        .returning(models.Session.family_id, models.Session.user_id)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.first()
+
+    if row is None:
+        session = await db.get(models.Session, jti)
+        if session is not None and await _concurrent_refresh(db, session, now):
+            # e.g. two tabs or a retried request, both get a token of the family
+            token, successor = _issue(session.user_id, session.family_id)
+            db.add(successor)
+            return token, session.family_id, session.user_id
+
+        if session is not None and session.rotated_at is not None:
+            # an exchanged token came back, someone else has a copy of it
+            logger.warning(
+                "[SILO] Refresh token reuse for user %s, revoking session %s",
+                session.user_id,
+                session.family_id,
+            )
+            await revoke_session(db, session.family_id)
+            await db.commit()
+
+        raise InvalidSessionError("Refresh token expired, revoked or already used")
+
+    family_id, user_id = row
+    token, session = _issue(user_id, family_id)
+    db.add(session)
+
+    return token, family_id, user_id
+
+
+async def revoke_session(db: AsyncSession, family_id: str) -> None:
+    """The revocation cache of this worker is updated when db commits"""
+    await db.execute(
+        update(models.Session)
+        .where(
+            models.Session.family_id == family_id, models.Session.revoked_at.is_(None)
+        )
+        .values(revoked_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
+    _revoke_on_commit(db, {family_id})
+
+
+async def revoke_user_sessions(db: AsyncSession, user_id: int) -> int:
+    now = datetime.now(timezone.utc)
+    result = await db.scalars(
+        update(models.Session)
+        .where(
+            models.Session.user_id == user_id,
+            models.Session.revoked_at.is_(None),
+            models.Session.expires_at > now,
+        )
+        .values(revoked_at=now)
+        .returning(models.Session.family_id)
+        .execution_options(synchronize_session=False)
+    )
+    family_ids = set(result.all())
+    _revoke_on_commit(db, family_ids)
+
+    return len(family_ids)
+
+
+async def load_revoked_sessions() -> None:
+    # revocations of the other workers, from the primary: a replica may lag
+    # behind and miss recent revocations
+    async with local_session() as db:
+        result = await db.scalars(
+            select(models.Session.family_id)
+            .where(
+                models.Session.revoked_at.is_not(None),
+                models.Session.expires_at > datetime.now(timezone.utc),
+            )
+            .distinct()
+        )
+        revoked_sessions.replace(set(result.all()))
+
+
+async def purge_expired_sessions() -> None:
+    async with local_session() as db:
+        await db.execute(
+            delete(models.Session).where(
+                models.Session.expires_at < datetime.now(timezone.utc)
+            )
+        )
+        await db.commit()
+
+
+async def refresh_revoked_sessions() -> None:
+    while True:
+        await asyncio.sleep(config.session_revocation_refresh_seconds)
+        try:
+            await load_revoked_sessions()
+        except Exception:
+            logger.exception("[SILO] Loading the revoked sessions failed")
@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+
+from silo import config
+from silo.schemas import UserRead
+from silo.utils import TTLCache, load_class_from_string
+
+
+class BaseUserCache(ABC):
+    """Cache of authenticated users, keyed by user id and token issue time (iat)"""
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+
+    @abstractmethod
+    async def get(self, user_id: int, issued_at: int | None) -> UserRead | None:
+        pass
+
+    @abstractmethod
+    async def set(self, user_id: int, issued_at: int | None, user: UserRead) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate(self, user_id: int) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+
+class MemoryUserCache(BaseUserCache):
+    """Per worker process cache"""
+
+    def __init__(self, max_size: int, ttl: int):
+        super().__init__(max_size, ttl)
+        self.cache: TTLCache[tuple[int, int | None], UserRead] = TTLCache(max_size, ttl)
+
+    async def get(self, user_id: int, issued_at: int | None) -> UserRead | None:
+        return self.cache.get((user_id, issued_at))
+
+    async def set(self, user_id: int, issued_at: int | None, user: UserRead) -> None:
+        self.cache.set((user_id, issued_at), user)
+
+    async def invalidate(self, user_id: int) -> None:
+        for key in self.cache:
+            if key[0] == user_id:
+                self.cache.pop(key)
+
+    async def clear(self) -> None:
+        self.cache.clear()
+
+
+def create_user_cache() -> BaseUserCache:
+    if isinstance(config.user_cache_class, str):
+        cache_class = load_class_from_string(config.user_cache_class)
+    else:
+        cache_class = config.user_cache_class
+
+    return cache_class(max_size=config.user_cache_max_size, ttl=config.user_cache_ttl)
+
+
+user_cache = create_user_cache()
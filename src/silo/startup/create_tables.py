@@ -1,7 +1,45 @@
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
 from silo.database.models import Base
 from silo.database import async_engine
+from silo.database.search import ITEM_SEARCH_DDL, ITEM_TRIGRAM_DDL
+from silo.database.silo_id import ITEM_SEQUENCE_SEED
+from silo.log import logger
+
+# columns added to existing tables (create_all() only creates missing tables)
+SCHEMA_UPGRADES = [
+    "ALTER TABLE document ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)",
+]
+
+# keyset pagination with order_by=updated_at (silo.utils.pagination.sort_keys)
+RECENTLY_UPDATED_DDL = [
+    f'CREATE INDEX IF NOT EXISTS ix_{table.name}_recently_updated ON "{table.name}" '
+    "((coalesce(updated_at, created_at)) DESC, id DESC)"
+    for table in Base.metadata.sorted_tables
+    if {"id", "created_at", "updated_at"} <= set(table.columns.keys())
+]
 
 
 async def create_tables() -> None:
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+        for statement in SCHEMA_UPGRADES:
+            await conn.execute(text(statement))
+
+        for statement in RECENTLY_UPDATED_DDL:
+            await conn.execute(text(statement))
+
+        for statement in ITEM_SEARCH_DDL:
+            await conn.execute(text(statement))
+
+        await conn.execute(text(ITEM_SEQUENCE_SEED))
+
+    try:
+        async with async_engine.begin() as conn:
+            for statement in ITEM_TRIGRAM_DDL:
+                await conn.execute(text(statement))
+    except DBAPIError as e:
+        # creating an extension may need additional privileges
+        logger.warning("Cannot create trigram indexes for the item search: %s", e)
@@ -1,59 +1,130 @@
-from pathlib import Path
+from collections.abc import AsyncIterator
+import hashlib
+import time
 import uuid
-import aiofiles
 
 from fastapi import HTTPException, UploadFile
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from silo import config
+from silo.database import models
 from silo.schemas.Document import DocumentMimeTypes
+from silo.utils.storage import BaseStorageBackend
+from silo.utils.storage_factory import document_storage
+
+CHUNK_SIZE = 256 * 1024  # bytes
+
+# leading bytes of the allowed document types
+SIGNATURES = {
+    b"%PDF-": DocumentMimeTypes.PDF,
+    b"\xff\xd8\xff": DocumentMimeTypes.JPEG,
+    b"\x89PNG\r\n\x1a\n": DocumentMimeTypes.PNG,
+}
 
 
 class DocumentManager:
-    def __init__(self):
-        self.upload_directory = Path(config.document_upload_directory)
-        self.upload_directory.mkdir(exist_ok=True)
+    def __init__(self, storage: BaseStorageBackend | None = None):
+        self.storage = storage if storage is not None else document_storage
 
         self.max_file_size = config.document_max_file_size
+        self.gc_grace_seconds = config.document_gc_grace_seconds
 
-    async def validate(self, file: UploadFile) -> dict:
-        content = await file.read()
-        await file.seek(0)
+    def sniff(self, head: bytes, content_type: str | None) -> DocumentMimeTypes:
+        for signature, mime_type in SIGNATURES.items():
+            if head.startswith(signature):
+                return mime_type
 
-        if len(content) > self.max_file_size:
+        raise HTTPException(
+            status_code=400, detail=f"Document type {content_type} not allowed"
+        )
+
+    def check_size(self, size: int) -> None:
+        if size > self.max_file_size:
             raise HTTPException(
                 status_code=413, detail="Document size exceeds the upload limit"
             )
 
+    def blob_key(self, content_hash: str) -> str:
+        # content addressed, sharded to keep the directories small
+        return f"{content_hash[:2]}/{content_hash[2:4]}/{content_hash}"
+
+    def thumbnail_key(self, content_hash: str, size: int) -> str:
+        return f"thumbnails/{self.blob_key(content_hash)}/{size}"
+
+    async def save(self, file: UploadFile) -> dict:
+        # the multipart parser already knows the size in most cases
+        if file.size is not None:
+            self.check_size(file.size)
+
+        temp_key = f".{uuid.uuid4()}.part"
+
+        size = 0
+        mime_type = None
+        content_hash = hashlib.sha256()
+
+        async def chunks() -> AsyncIterator[bytes]:
+            nonlocal size, mime_type
+            while chunk := await file.read(CHUNK_SIZE):
+                if mime_type is None:
+                    mime_type = self.sniff(chunk, file.content_type)
+
+                size += len(chunk)
+                self.check_size(size)
+                content_hash.update(chunk)
+                yield chunk
+
         try:
-            DocumentMimeTypes(file.content_type)
-        except ValueError:
-            raise HTTPException(
-                status_code=400, detail=f"Document type {file.content_type} not allowed"
-            )
+            await self.storage.write(temp_key, chunks())
+
+            if mime_type is None:
+                raise HTTPException(status_code=400, detail="Document is empty")
+
+            key = self.blob_key(content_hash.hexdigest())
+            if await self.storage.exists(key):
+                # same content already stored, refresh the modification time so a
+                # concurrent release() or garbage collection keeps the blob
+                await self.storage.touch(key)
+                await self.storage.delete(temp_key)
+            else:
+                await self.storage.move(temp_key, key)
+        except BaseException:
+            await self.storage.delete(temp_key)
+            raise
 
         return {
-            "content": content,
-            "size": len(content),
-            "mime_type": file.content_type,
+            "size": size,
+            "mime_type": mime_type.value,
             "filename": file.filename,
+            "file_path": key,
+            "content_hash": content_hash.hexdigest(),
         }
 
-    async def save(self, file: UploadFile) -> str:
-        fdata = await self.validate(file)
-        extension = Path(fdata["filename"]).suffix
-        filename = f"{str(uuid.uuid4())}{extension}"
-        filepath = self.upload_directory / filename
+    def is_stale(
+        self, modified: float | None, grace_seconds: int | None = None
+    ) -> bool:
+        if grace_seconds is None:
+            grace_seconds = self.gc_grace_seconds
 
-        async with aiofiles.open(filepath, "wb") as filebuffer:
-            await filebuffer.write(fdata["content"])
+        return modified is not None and time.time() - modified > grace_seconds
 
-        return str(filepath.relative_to(self.upload_directory))
+    async def release(self, session: AsyncSession, filepath: str) -> bool:
+        """Delete the file once no Document references it anymore."""
+        references = await session.scalar(
+            select(func.count())
+            .select_from(models.Document)
+            .where(models.Document.file_path == filepath)
+        )
+        # a blob touched recently might be referenced by an upload that is not
+        # committed yet, the garbage collection picks it up later
+        if references or not self.is_stale(await self.storage.modified(filepath)):
+            return False
 
-    async def delete(self, filepath: str) -> bool:
-        ffilepath = self.upload_directory / filepath
+        content_hash = filepath.rsplit("/", 1)[-1]
+        for size in config.document_thumbnail_sizes:
+            await self.delete(self.thumbnail_key(content_hash, size))
 
-        if ffilepath.exists():
-            ffilepath.unlink()
-            return True
+        return await self.delete(filepath)
 
-        return False
+    async def delete(self, filepath: str) -> bool:
+        return await self.storage.delete(filepath)
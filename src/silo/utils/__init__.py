@@ -1,5 +1,8 @@
 from .utils import match_any_permission
 from .str_load_class import load_class_from_string
+from .cache import TTLCache
+from .pagination import paginate, sort_keys
+from .streaming import ExportFormat, stream_export
 
 
 from .DocumentManager import DocumentManager
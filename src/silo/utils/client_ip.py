@@ -0,0 +1,60 @@
+from ipaddress import IPv4Network, IPv6Network, ip_address
+
+from fastapi import Request
+
+from silo import config
+
+
+def _strip_port(node: str) -> str:
+    # Forwarded: for="[2001:db8::17]:4711" or for=192.0.2.60:4711
+    node = node.strip().strip('"')
+    if node.startswith("["):
+        return node[1:].split("]", 1)[0]
+    if node.count(":") == 1:
+        return node.split(":", 1)[0]
+    return node
+
+
+def forwarded_hops(request: Request) -> list[str]:
+    """Client addresses added by the proxies, the nearest proxy last"""
+    forwarded = request.headers.getlist("forwarded")
+    if forwarded:
+        hops = []
+        for element in ",".join(forwarded).split(","):
+            for pair in element.split(";"):
+                key, _, value = pair.partition("=")
+                if key.strip().lower() == "for":
+                    hops.append(_strip_port(value))
+        return hops
+
+    return [
+        hop.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for hop in header.split(",")
+        if hop.strip()
+    ]
+
+
+def is_trusted(address: str, trusted_proxies: list[IPv4Network | IPv6Network]) -> bool:
+    try:
+        ip = ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted_proxies)
+
+
+def get_client_ip(request: Request) -> str:
+    """Address of the client, behind trusted proxies (config.trusted_proxies)
+    the right-most address of the forwarded headers which is not a trusted
+    proxy. Headers of untrusted peers are ignored, they can be forged"""
+    address = request.client.host if request.client else "unknown"
+    trusted_proxies = config.trusted_proxies
+    if not trusted_proxies or not is_trusted(address, trusted_proxies):
+        return address
+
+    for hop in reversed(forwarded_hops(request)):
+        address = hop
+        if not is_trusted(hop, trusted_proxies):
+            break
+
+    return address
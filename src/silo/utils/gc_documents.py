@@ -0,0 +1,66 @@
+"""Remove uploaded files that no Document references anymore.
+
+python -m silo.utils.gc_documents [--grace-seconds N] [--dry-run]
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import select
+
+from silo.database import async_engine, local_session, models
+from silo.utils.DocumentManager import DocumentManager
+
+
+async def gc_documents(grace_seconds: int | None = None, dry_run: bool = False) -> int:
+    doc_manager = DocumentManager()
+
+    async with local_session() as session:
+        referenced = set(
+            (await session.scalars(select(models.Document.file_path).distinct())).all()
+        )
+
+    removed = 0
+    async for key, modified in doc_manager.storage.list():
+        # thumbnails live as long as their original
+        if key.startswith("thumbnails/"):
+            key_referenced = (
+                key.removeprefix("thumbnails/").rsplit("/", 1)[0] in referenced
+            )
+        else:
+            key_referenced = key in referenced
+
+        # temp files of aborted uploads are never referenced
+        if key_referenced or not doc_manager.is_stale(modified, grace_seconds):
+            continue
+
+        print(f"[SILO] Unreferenced file {key}")
+        if not dry_run:
+            await doc_manager.delete(key)
+        removed += 1
+
+    await doc_manager.storage.close()
+    await async_engine.dispose()
+
+    return removed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--grace-seconds",
+        type=int,
+        default=None,
+        help="keep files younger than this (default: SILO_DOCUMENT_GC_GRACE_SECONDS)",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="only list the files to remove"
+    )
+    args = parser.parse_args()
+
+    removed = asyncio.run(gc_documents(args.grace_seconds, args.dry_run))
+    print(f"[SILO] {removed} unreferenced file(s) removed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import asyncio
+import os
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from silo import config
+from silo.database.pool import PoolStats, pool_status
+from silo.log import logger
+
+# optional dependency, without prometheus_client no metrics are collected
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+        multiprocess,
+    )
+except ImportError:
+    generate_latest = None
+
+# gunicorn/uvicorn workers write their samples into this directory, the worker
+# answering the scrape aggregates them
+MULTIPROCESS_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+metrics_available = generate_latest is not None
+
+if metrics_available:
+    REQUESTS = Counter(
+        "silo_http_requests_total",
+        "HTTP requests by route template and status code",
+        ["method", "route", "status"],
+    )
+    REQUEST_DURATION = Histogram(
+        "silo_http_request_duration_seconds",
+        "HTTP request latency by route template",
+        ["method", "route"],
+    )
+    REQUESTS_IN_FLIGHT = Gauge(
+        "silo_http_requests_in_flight",
+        "HTTP requests currently being handled",
+        multiprocess_mode="livesum",
+    )
+    DB_POOL_CONNECTIONS = Gauge(
+        "silo_db_pool_connections",
+        "Database pool connections by state",
+        ["state"],
+        multiprocess_mode="livesum",
+    )
+    DB_POOL_CHECKOUTS = Counter(
+        "silo_db_pool_checkouts_total",
+        "Database connection checkouts",
+    )
+    DB_POOL_TIMEOUTS = Counter(
+        "silo_db_pool_timeouts_total",
+        "Database connection checkouts which timed out",
+    )
+    DB_POOL_WAIT = Counter(
+        "silo_db_pool_wait_seconds_total",
+        "Time spent waiting for a free database connection",
+    )
+    AUTH_DURATION = Histogram(
+        "silo_auth_duration_seconds",
+        "Directory (LDAP) authentication latency",
+        ["result"],
+    )
+    AUTH_QUEUE_WAIT = Histogram(
+        "silo_auth_queue_wait_seconds",
+        "Time authentications waited for a free authenticator thread",
+    )
+    UPLOAD_BYTES = Counter(
+        "silo_document_upload_bytes_total",
+        "Bytes of uploaded documents",
+    )
+    EVENT_LOOP_LAG = Histogram(
+        "silo_event_loop_lag_seconds",
+        "Delay of the event loop in waking up a sleeping task",
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+    )
+
+
+def route_template(scope: dict) -> str:
+    # route templates keep the label cardinality bounded, unlike raw paths
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def observe_request(method: str, route: str, status: int, seconds: float) -> None:
+    if metrics_available:
+        REQUESTS.labels(method, route, str(status)).inc()
+        REQUEST_DURATION.labels(method, route).observe(seconds)
+
+
+def track_in_flight(delta: int) -> None:
+    if metrics_available:
+        REQUESTS_IN_FLIGHT.inc(delta)
+
+
+def observe_authentication(seconds: float, queue_wait: float, error: bool) -> None:
+    if metrics_available:
+        AUTH_DURATION.labels("error" if error else "ok").observe(seconds)
+        AUTH_QUEUE_WAIT.observe(queue_wait)
+
+
+def observe_upload(size: int) -> None:
+    if metrics_available:
+        UPLOAD_BYTES.inc(size)
+
+
+def sample_pools(engines: list[AsyncEngine], seen: PoolStats) -> None:
+    status = [pool_status(engine.pool) for engine in engines]
+    for state in ("checked_out", "checked_in", "overflow"):
+        DB_POOL_CONNECTIONS.labels(state).set(sum(s[state] for s in status))
+
+    # the pools count cumulative totals, the counters get the increase
+    checkouts = sum(s["checkouts"] for s in status)
+    timeouts = sum(s["timeouts"] for s in status)
+    wait = sum(s["wait_seconds_total"] for s in status)
+    DB_POOL_CHECKOUTS.inc(max(checkouts - seen.checkouts, 0))
+    DB_POOL_TIMEOUTS.inc(max(timeouts - seen.timeouts, 0))
+    DB_POOL_WAIT.inc(max(wait - seen.wait_seconds_total, 0.0))
+    seen.checkouts, seen.timeouts, seen.wait_seconds_total = checkouts, timeouts, wait
+
+
+async def monitor_event_loop(engines: list[AsyncEngine]) -> None:
+    """Measures the event loop lag and samples the database pools"""
+    if not metrics_available:
+        return
+
+    interval = config.metrics_sample_interval
+    seen = PoolStats()
+    while True:
+        start = perf_counter()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(perf_counter() - start - interval, 0.0))
+
+        try:
+            sample_pools(engines, seen)
+        except Exception as e:
+            logger.warning(f"Cannot sample the database pools: {e}")
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if MULTIPROCESS_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    return generate_latest(registry), CONTENT_TYPE_LATEST
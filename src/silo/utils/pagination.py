@@ -0,0 +1,145 @@
+import base64
+import binascii
+import json
+import math
+from datetime import datetime
+from typing import Any, TypeVar
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    DateTime,
+    Integer,
+    Select,
+    and_,
+    func,
+    or_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from silo.schemas import CursorParams, Page
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+DEFAULT_PAGE_SIZE = 50
+
+# (sort expression, descending)
+SortKey = tuple[ColumnElement, bool]
+
+
+def sort_keys(model, order_by: str = "id") -> list[SortKey]:
+    if order_by == "updated_at":
+        # rows which were never updated are sorted by their creation date
+        return [
+            (func.coalesce(model.updated_at, model.created_at), True),
+            (model.id, True),
+        ]
+    return [(model.id, False)]
+
+
+def encode_cursor(values: list[Any]) -> str:
+    payload = [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _cursor_value(value: Any, expression: ColumnElement) -> Any:
+    # a tampered cursor must not reach the database with a value of the wrong type
+    column_type = expression.type
+    if isinstance(column_type, DateTime):
+        value = datetime.fromisoformat(value["dt"])
+        if (value.tzinfo is not None) != bool(column_type.timezone):
+            raise ValueError("cursor datetime does not match the column")
+        return value
+
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError("cursor value is not a number")
+    if isinstance(column_type, Integer):
+        bound = 2**63 if isinstance(column_type, BigInteger) else 2**31
+        if not isinstance(value, int) or not -bound <= value < bound:
+            raise ValueError("cursor value is out of range")
+    elif not math.isfinite(value):
+        raise ValueError("cursor value is not finite")
+    return value
+
+
+def decode_cursor(cursor: str, keys: list[SortKey]) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(keys):
+            raise ValueError("cursor does not match the sort order")
+        return [
+            _cursor_value(value, expression)
+            for value, (expression, _) in zip(payload, keys)
+        ]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _after(keys: list[SortKey], values: list[Any]) -> ColumnElement[bool]:
+    # (k0 > v0) OR (k0 = v0 AND k1 > v1) OR ... (direction aware)
+    clauses = []
+    for i, (expression, descending) in enumerate(keys):
+        equal = [key == value for (key, _), value in zip(keys[:i], values[:i])]
+        following = expression < values[i] if descending else expression > values[i]
+        clauses.append(and_(*equal, following))
+    return or_(*clauses)
+
+
+async def paginate(
+    session: AsyncSession,
+    statement: Select,
+    params: CursorParams,
+    schema: type[SchemaT],
+    keys: list[SortKey] | None = None,
+    offset: int = 0,
+) -> Page[SchemaT] | list[SchemaT]:
+    if keys is None:
+        model = statement.column_descriptions[0]["entity"]
+        keys = sort_keys(model, params.order_by)
+
+    statement = statement.order_by(
+        *[
+            expression.desc() if descending else expression.asc()
+            for expression, descending in keys
+        ]
+    )
+
+    # without a cursor: plain list (limit and offset are optional)
+    if not params.paged:
+        if offset:
+            statement = statement.offset(offset)
+        if params.limit is not None:
+            statement = statement.limit(params.limit)
+        result = await session.scalars(statement)
+        return [schema.model_validate(row, from_attributes=True) for row in result]
+
+    limit = params.limit or DEFAULT_PAGE_SIZE
+    statement = statement.add_columns(
+        *[expression.label(f"cursor_{i}") for i, (expression, _) in enumerate(keys)]
+    )
+
+    if params.cursor:
+        statement = statement.where(_after(keys, decode_cursor(params.cursor, keys)))
+    elif offset:
+        statement = statement.offset(offset)
+
+    # fetch one more row to know if there is a next page
+    result = await session.execute(statement.limit(limit + 1))
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(list(rows[-1][1:]))
+
+    return Page[schema](
+        items=[schema.model_validate(row[0], from_attributes=True) for row in rows],
+        next_cursor=next_cursor,
+    )
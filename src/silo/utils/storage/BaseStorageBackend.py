@@ -0,0 +1,58 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
+
+
+class BaseStorageBackend(ABC):
+    """Stores document files under "/" separated keys"""
+
+    def __init__(self, max_concurrency: int, max_streams: int = 64):
+        # limits the storage operations running at the same time (per worker process)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        # reads are streamed to clients at the client's pace, they have their own
+        # limit so slow downloads cannot hold up writes and deletes
+        self.read_semaphore = asyncio.Semaphore(max_streams)
+
+    @abstractmethod
+    async def write(self, key: str, chunks: AsyncIterable[bytes]) -> None:
+        pass
+
+    @abstractmethod
+    def read(self, key: str) -> AsyncIterator[bytes]:
+        pass
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def modified(self, key: str) -> float | None:
+        """Last modification as unix timestamp, None if the key does not exist"""
+
+    @abstractmethod
+    async def touch(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def move(self, source_key: str, target_key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def list(self) -> AsyncIterator[tuple[str, float]]:
+        """All keys with their last modification"""
+
+    async def presigned_url(
+        self, key: str, filename: str, media_type: str, expires: int
+    ) -> str | None:
+        return None
+
+    def local_path(self, key: str) -> Path | None:
+        return None
+
+    async def close(self) -> None:
+        pass
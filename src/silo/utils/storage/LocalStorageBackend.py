@@ -0,0 +1,80 @@
+import os
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
+
+import aiofiles
+import aiofiles.os
+
+from silo.utils.storage import BaseStorageBackend
+
+CHUNK_SIZE = 256 * 1024  # bytes
+
+
+class LocalStorageBackend(BaseStorageBackend):
+    def __init__(self, directory: str, max_concurrency: int, max_streams: int = 64):
+        super().__init__(max_concurrency, max_streams)
+        self.directory = Path(directory)
+        self.directory.mkdir(exist_ok=True)
+
+    def local_path(self, key: str) -> Path:
+        return self.directory / key
+
+    async def write(self, key: str, chunks: AsyncIterable[bytes]) -> None:
+        path = self.local_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        async with self.semaphore:
+            async with aiofiles.open(path, "wb") as filebuffer:
+                async for chunk in chunks:
+                    await filebuffer.write(chunk)
+
+    async def read(self, key: str) -> AsyncIterator[bytes]:
+        async with self.read_semaphore:
+            async with aiofiles.open(self.local_path(key), "rb") as filebuffer:
+                while chunk := await filebuffer.read(CHUNK_SIZE):
+                    yield chunk
+
+    async def exists(self, key: str) -> bool:
+        return await aiofiles.os.path.isfile(self.local_path(key))
+
+    async def modified(self, key: str) -> float | None:
+        try:
+            return (await aiofiles.os.stat(self.local_path(key))).st_mtime
+        except FileNotFoundError:
+            return None
+
+    async def touch(self, key: str) -> None:
+        os.utime(self.local_path(key))
+
+    async def move(self, source_key: str, target_key: str) -> None:
+        target = self.local_path(target_key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # atomic, the file never shows up partially written
+        await aiofiles.os.replace(self.local_path(source_key), target)
+
+    async def delete(self, key: str) -> bool:
+        path = self.local_path(key)
+        try:
+            await aiofiles.os.remove(path)
+        except FileNotFoundError:
+            return False
+
+        # drop empty shard directories
+        for parent in path.parents:
+            if parent == self.directory or not parent.is_relative_to(self.directory):
+                break
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+
+        return True
+
+    async def list(self) -> AsyncIterator[tuple[str, float]]:
+        for path in self.directory.rglob("*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.is_file():
+                yield path.relative_to(self.directory).as_posix(), stat.st_mtime
@@ -0,0 +1,338 @@
+import hashlib
+import hmac
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote, urlsplit
+from xml.etree import ElementTree
+
+import httpx
+
+from silo.utils.storage import BaseStorageBackend
+from silo.utils.storage.exceptions import StorageError
+
+# S3 requires at least 5 MiB for every part but the last one
+MIN_PART_SIZE = 5 * 1024 * 1024
+EMPTY_HASH = hashlib.sha256(b"").hexdigest()
+XML_NAMESPACE = {"s3": "http://s3.amazonaws.com/doc/2006-03-01/"}
+
+
+def _quote(value: str, safe: str = "-_.~") -> str:
+    return quote(value, safe=safe)
+
+
+def _query(params: dict[str, str]) -> str:
+    return "&".join(
+        f"{_quote(name)}={_quote(value)}" for name, value in sorted(params.items())
+    )
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode(), hashlib.sha256).digest()
+
+
+class S3StorageBackend(BaseStorageBackend):
+    """S3 compatible object storage (AWS S3, MinIO, Ceph, ...), path-style addressing"""
+
+    def __init__(
+        self,
+        endpoint_url: str,
+        bucket: str,
+        access_key: str,
+        secret_key: str,
+        region: str,
+        prefix: str,
+        part_size: int,
+        max_concurrency: int,
+        max_streams: int = 64,
+    ):
+        super().__init__(max_concurrency, max_streams)
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.host = urlsplit(self.endpoint_url).netloc
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.part_size = max(part_size, MIN_PART_SIZE)
+
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=max_concurrency + max_streams),
+        )
+
+    # request signing (AWS Signature Version 4)
+
+    def _path(self, key: str | None = None) -> str:
+        path = f"/{self.bucket}"
+        if key is not None:
+            path += "/" + _quote(self.prefix + key, safe="-_.~/")
+        return path
+
+    def _scope(self, now: datetime) -> str:
+        return f"{now:%Y%m%d}/{self.region}/s3/aws4_request"
+
+    def _signature(self, now: datetime, canonical_request: str) -> str:
+        string_to_sign = "\n".join(
+            [
+                "AWS4-HMAC-SHA256",
+                f"{now:%Y%m%dT%H%M%SZ}",
+                self._scope(now),
+                hashlib.sha256(canonical_request.encode()).hexdigest(),
+            ]
+        )
+
+        key = _hmac(f"AWS4{self.secret_key}".encode(), f"{now:%Y%m%d}")
+        for part in (self.region, "s3", "aws4_request"):
+            key = _hmac(key, part)
+
+        return hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    def _canonical_request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, str],
+        headers: dict[str, str],
+        payload_hash: str,
+    ) -> tuple[str, str]:
+        signed_headers = ";".join(sorted(headers))
+        canonical_headers = "".join(
+            f"{name}:{headers[name].strip()}\n" for name in sorted(headers)
+        )
+        canonical_request = "\n".join(
+            [
+                method,
+                path,
+                _query(params),
+                canonical_headers,
+                signed_headers,
+                payload_hash,
+            ]
+        )
+        return canonical_request, signed_headers
+
+    def _signed_request(
+        self,
+        method: str,
+        key: str | None,
+        params: dict[str, str],
+        headers: dict[str, str],
+        content: bytes,
+    ) -> tuple[str, dict[str, str]]:
+        now = datetime.now(timezone.utc)
+        payload_hash = hashlib.sha256(content).hexdigest() if content else EMPTY_HASH
+        headers = {
+            **{name.lower(): value for name, value in headers.items()},
+            "host": self.host,
+            "x-amz-date": f"{now:%Y%m%dT%H%M%SZ}",
+            "x-amz-content-sha256": payload_hash,
+        }
+        path = self._path(key)
+
+        canonical_request, signed_headers = self._canonical_request(
+            method, path, params, headers, payload_hash
+        )
+        headers["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key}/{self._scope(now)}, "
+            f"SignedHeaders={signed_headers}, "
+            f"Signature={self._signature(now, canonical_request)}"
+        )
+
+        # the query string has to be sent exactly as it was signed
+        query = _query(params)
+        url = f"{self.endpoint_url}{path}" + (f"?{query}" if query else "")
+
+        return url, headers
+
+    async def _request(
+        self,
+        method: str,
+        key: str | None = None,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        content: bytes = b"",
+        expected: tuple[int, ...] = (200,),
+    ) -> httpx.Response:
+        url, headers = self._signed_request(
+            method, key, params or {}, headers or {}, content
+        )
+
+        async with self.semaphore:
+            try:
+                response = await self.client.request(
+                    method, url, headers=headers, content=content
+                )
+            except httpx.HTTPError as e:
+                raise StorageError(f"S3 {method} {key} failed: {e}") from e
+
+        if response.status_code not in expected:
+            raise StorageError(
+                f"S3 {method} {key} failed with status {response.status_code}: {response.text}"
+            )
+
+        return response
+
+    # storage operations
+
+    async def write(self, key: str, chunks: AsyncIterable[bytes]) -> None:
+        buffer = bytearray()
+        upload_id = None
+        parts = []
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                while len(buffer) >= self.part_size:
+                    if upload_id is None:
+                        upload_id = await self._create_multipart_upload(key)
+                    part, buffer = buffer[: self.part_size], buffer[self.part_size :]
+                    parts.append(
+                        await self._upload_part(key, upload_id, len(parts) + 1, part)
+                    )
+
+            # small files are uploaded with a single request
+            if upload_id is None:
+                await self._request("PUT", key, content=bytes(buffer))
+                return
+
+            if buffer:
+                parts.append(
+                    await self._upload_part(key, upload_id, len(parts) + 1, buffer)
+                )
+            await self._complete_multipart_upload(key, upload_id, parts)
+        except BaseException:
+            if upload_id is not None:
+                await self._request(
+                    "DELETE", key, params={"uploadId": upload_id}, expected=(204, 404)
+                )
+            raise
+
+    async def _create_multipart_upload(self, key: str) -> str:
+        response = await self._request("POST", key, params={"uploads": ""})
+        upload_id = ElementTree.fromstring(response.content).find(
+            "s3:UploadId", XML_NAMESPACE
+        )
+        if upload_id is None or not upload_id.text:
+            raise StorageError(f"S3 multipart upload for {key} returned no UploadId")
+
+        return upload_id.text
+
+    async def _upload_part(
+        self, key: str, upload_id: str, part_number: int, content: bytes
+    ) -> str:
+        response = await self._request(
+            "PUT",
+            key,
+            params={"partNumber": str(part_number), "uploadId": upload_id},
+            content=bytes(content),
+        )
+        return response.headers["etag"]
+
+    async def _complete_multipart_upload(
+        self, key: str, upload_id: str, etags: list[str]
+    ) -> None:
+        body = "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+            for number, etag in enumerate(etags, start=1)
+        )
+        response = await self._request(
+            "POST",
+            key,
+            params={"uploadId": upload_id},
+            content=f"<CompleteMultipartUpload>{body}</CompleteMultipartUpload>".encode(),
+        )
+        # errors of the complete request can come with status 200
+        if b"<Error>" in response.content:
+            raise StorageError(f"S3 multipart upload for {key} failed: {response.text}")
+
+    async def read(self, key: str) -> AsyncIterator[bytes]:
+        url, headers = self._signed_request("GET", key, {}, {}, b"")
+
+        async with self.read_semaphore:
+            try:
+                async with self.client.stream("GET", url, headers=headers) as response:
+                    if response.status_code != 200:
+                        raise StorageError(
+                            f"S3 GET {key} failed with status {response.status_code}"
+                        )
+                    async for chunk in response.aiter_bytes():
+                        yield chunk
+            except httpx.HTTPError as e:
+                raise StorageError(f"S3 GET {key} failed: {e}") from e
+
+    async def _head(self, key: str) -> httpx.Response:
+        return await self._request("HEAD", key, expected=(200, 404))
+
+    async def exists(self, key: str) -> bool:
+        return (await self._head(key)).status_code == 200
+
+    async def modified(self, key: str) -> float | None:
+        response = await self._head(key)
+        if response.status_code == 404:
+            return None
+
+        return parsedate_to_datetime(response.headers["last-modified"]).timestamp()
+
+    async def _copy(self, source_key: str, target_key: str, **headers: str) -> None:
+        response = await self._request(
+            "PUT",
+            target_key,
+            headers={"x-amz-copy-source": self._path(source_key), **headers},
+        )
+        if b"<Error>" in response.content:
+            raise StorageError(f"S3 copy of {source_key} failed: {response.text}")
+
+    async def touch(self, key: str) -> None:
+        # copying an object onto itself refreshes its last modification
+        await self._copy(key, key, **{"x-amz-metadata-directive": "REPLACE"})
+
+    async def move(self, source_key: str, target_key: str) -> None:
+        await self._copy(source_key, target_key)
+        await self.delete(source_key)
+
+    async def delete(self, key: str) -> bool:
+        await self._request("DELETE", key, expected=(204, 200, 404))
+        return True
+
+    async def list(self) -> AsyncIterator[tuple[str, float]]:
+        params = {"list-type": "2", "prefix": self.prefix}
+        while True:
+            response = await self._request("GET", params=params)
+            result = ElementTree.fromstring(response.content)
+
+            for content in result.iterfind("s3:Contents", XML_NAMESPACE):
+                key = content.findtext("s3:Key", "", XML_NAMESPACE)
+                last_modified = datetime.fromisoformat(
+                    content.findtext("s3:LastModified", "", XML_NAMESPACE)
+                )
+                yield key.removeprefix(self.prefix), last_modified.timestamp()
+
+            token = result.findtext("s3:NextContinuationToken", None, XML_NAMESPACE)
+            if not token:
+                break
+            params = {**params, "continuation-token": token}
+
+    async def presigned_url(
+        self, key: str, filename: str, media_type: str, expires: int
+    ) -> str:
+        now = datetime.now(timezone.utc)
+        path = self._path(key)
+        params = {
+            "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+            "X-Amz-Credential": f"{self.access_key}/{self._scope(now)}",
+            "X-Amz-Date": f"{now:%Y%m%dT%H%M%SZ}",
+            "X-Amz-Expires": str(expires),
+            "X-Amz-SignedHeaders": "host",
+            "response-content-disposition": f"inline; filename*=utf-8''{_quote(filename)}",
+            "response-content-type": media_type,
+        }
+        canonical_request, _ = self._canonical_request(
+            "GET", path, params, {"host": self.host}, "UNSIGNED-PAYLOAD"
+        )
+        params["X-Amz-Signature"] = self._signature(now, canonical_request)
+
+        return f"{self.endpoint_url}{path}?{_query(params)}"
+
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,4 @@
+from .BaseStorageBackend import BaseStorageBackend
+from .LocalStorageBackend import LocalStorageBackend
+from .S3StorageBackend import S3StorageBackend
+from .exceptions import StorageError
@@ -0,0 +1,49 @@
+from silo import config
+from silo.utils.str_load_class import load_class_from_string
+from silo.utils import storage
+
+
+def create_storage_backend() -> storage.BaseStorageBackend:
+    if isinstance(config.document_storage_backend, str):
+        storage_class = load_class_from_string(config.document_storage_backend)
+    else:
+        storage_class = config.document_storage_backend
+
+    match storage_class:
+        case storage.LocalStorageBackend:
+            return storage_class(
+                directory=config.document_upload_directory,
+                max_concurrency=config.document_storage_max_concurrency,
+                max_streams=config.document_storage_max_streams,
+            )
+
+        case storage.S3StorageBackend:
+            if (
+                config.document_s3_endpoint_url is None
+                or config.document_s3_bucket is None
+                or config.document_s3_access_key is None
+                or config.document_s3_secret_key is None
+            ):
+                raise ValueError(
+                    "[SILO] S3StorageBackend requires SILO_DOCUMENT_S3_ENDPOINT_URL, SILO_DOCUMENT_S3_BUCKET, SILO_DOCUMENT_S3_ACCESS_KEY and SILO_DOCUMENT_S3_SECRET_KEY"
+                )
+            return storage_class(
+                endpoint_url=config.document_s3_endpoint_url,
+                bucket=config.document_s3_bucket,
+                access_key=config.document_s3_access_key,
+                secret_key=config.document_s3_secret_key.get_secret_value(),
+                region=config.document_s3_region,
+                prefix=config.document_s3_prefix,
+                part_size=config.document_s3_part_size,
+                max_concurrency=config.document_storage_max_concurrency,
+                max_streams=config.document_storage_max_streams,
+            )
+
+        case _:
+            return storage_class(
+                max_concurrency=config.document_storage_max_concurrency,
+                max_streams=config.document_storage_max_streams,
+            )
+
+
+document_storage = create_storage_backend()
@@ -0,0 +1,65 @@
+from typing import AsyncIterator, Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select
+
+from silo.database import read_session_factory
+
+ExportFormat = Literal["ndjson", "json"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+async def _export_rows(
+    statement: Select, schema: type[BaseModel], fmt: ExportFormat, chunk_size: int
+) -> AsyncIterator[bytes]:
+    # the request session may already be closed while the response is streamed,
+    # so the export uses its own session (server-side cursor)
+    async with read_session_factory()() as session:
+        result = await session.stream_scalars(
+            statement.execution_options(yield_per=chunk_size)
+        )
+
+        separator = b"\n" if fmt == "ndjson" else b","
+        first = True
+        if fmt == "json":
+            yield b"["
+
+        async for partition in result.partitions():
+            chunk = bytearray()
+            for row in partition:
+                if not first and fmt == "json":
+                    chunk += separator
+                chunk += (
+                    schema.model_validate(row, from_attributes=True)
+                    .model_dump_json()
+                    .encode()
+                )
+                if fmt == "ndjson":
+                    chunk += separator
+                first = False
+
+            yield bytes(chunk)
+
+        if fmt == "json":
+            yield b"]"
+
+
+def stream_export(
+    statement: Select,
+    schema: type[BaseModel],
+    fmt: ExportFormat = "ndjson",
+    filename: str = "export",
+    chunk_size: int = 500,
+) -> StreamingResponse:
+    return StreamingResponse(
+        _export_rows(statement, schema, fmt, chunk_size),
+        media_type=MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{fmt}"',
+        },
+    )
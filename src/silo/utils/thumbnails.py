@@ -0,0 +1,157 @@
+import asyncio
+import io
+import multiprocessing
+import shutil
+import subprocess
+import tempfile
+import uuid
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from silo import config
+from silo.log import logger
+from silo.schemas.Document import DocumentMimeTypes
+from silo.utils.DocumentManager import DocumentManager
+
+# optional dependency ("thumbnails" extra), without Pillow no thumbnails are generated
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+THUMBNAIL_MIME_TYPE = "image/webp"
+IMAGE_MIME_TYPES = {
+    DocumentMimeTypes.JPEG.value,
+    DocumentMimeTypes.JPG.value,
+    DocumentMimeTypes.PNG.value,
+}
+PDF_RENDER_TIMEOUT = 30  # seconds
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # forking the threaded server process is unsafe
+        _executor = ProcessPoolExecutor(
+            max_workers=config.document_thumbnail_workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def check_thumbnail_support() -> None:
+    if Image is None:
+        logger.warning(
+            "[SILO] Pillow is not installed, no document thumbnails are generated "
+            "(install the 'thumbnails' extra)"
+        )
+    elif shutil.which("pdftoppm") is None:
+        logger.warning("[SILO] pdftoppm is not installed, no PDF thumbnails")
+
+
+def can_render(mime_type: str) -> bool:
+    if Image is None:
+        return False
+
+    if mime_type in IMAGE_MIME_TYPES:
+        return True
+
+    # first page of PDFs is rendered with poppler (if installed)
+    return (
+        mime_type == DocumentMimeTypes.PDF.value
+        and shutil.which("pdftoppm") is not None
+    )
+
+
+def _render_pdf_page(data: bytes, size: int) -> bytes:
+    with tempfile.TemporaryDirectory() as directory:
+        pdf_path = Path(directory) / "document.pdf"
+        pdf_path.write_bytes(data)
+
+        subprocess.run(
+            [
+                "pdftoppm",
+                "-png",
+                "-singlefile",
+                "-f",
+                "1",
+                "-l",
+                "1",
+                "-scale-to",
+                str(size),
+                str(pdf_path),
+                str(Path(directory) / "page"),
+            ],
+            check=True,
+            capture_output=True,
+            timeout=PDF_RENDER_TIMEOUT,
+        )
+
+        return (Path(directory) / "page.png").read_bytes()
+
+
+def render_thumbnails(
+    data: bytes, mime_type: str, sizes: list[int]
+) -> dict[int, bytes]:
+    # runs in a worker process
+    sizes = sorted(sizes, reverse=True)
+    if mime_type == DocumentMimeTypes.PDF.value:
+        data = _render_pdf_page(data, sizes[0])
+
+    thumbnails = {}
+    with Image.open(io.BytesIO(data)) as image:
+        # JPEGs are decoded at a reduced scale right away
+        image.draft("RGB", (sizes[0], sizes[0]))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+
+        # every size is scaled down from the previous (larger) one
+        for size in sizes:
+            image.thumbnail((size, size))
+            buffer = io.BytesIO()
+            image.save(buffer, format="WEBP", quality=80)
+            thumbnails[size] = buffer.getvalue()
+
+    return thumbnails
+
+
+async def _single_chunk(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+async def generate_thumbnails(
+    doc_manager: DocumentManager, key: str, content_hash: str, mime_type: str
+) -> None:
+    sizes = config.document_thumbnail_sizes
+    if not sizes or not can_render(mime_type):
+        return
+
+    storage = doc_manager.storage
+    # same content uploaded before
+    if await storage.exists(doc_manager.thumbnail_key(content_hash, max(sizes))):
+        return
+
+    try:
+        data = b"".join([chunk async for chunk in storage.read(key)])
+        thumbnails = await asyncio.get_running_loop().run_in_executor(
+            get_executor(), render_thumbnails, data, mime_type, sizes
+        )
+
+        for size, thumbnail in thumbnails.items():
+            temp_key = f".{uuid.uuid4()}.part"
+            await storage.write(temp_key, _single_chunk(thumbnail))
+            await storage.move(temp_key, doc_manager.thumbnail_key(content_hash, size))
+    except Exception:
+        logger.exception("[SILO] Thumbnail generation for %s failed", key)
@@ -0,0 +1,50 @@
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# form fields, part headers and boundaries of an upload besides the file
+MULTIPART_OVERHEAD = 64 * 1024  # bytes
+
+DETAIL = "Document size exceeds the upload limit"
+
+
+class UploadSizeLimitMiddleware:
+    """Rejects multipart uploads larger than the document size limit (413)
+    while they are received, before the form parser spools the files to disk.
+    DocumentManager checks the exact size of the file afterwards"""
+
+    def __init__(self, app: ASGIApp, max_file_size: int):
+        self.app = app
+        self.max_body_size = max_file_size + MULTIPART_OVERHEAD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if not headers.get("content-type", "").startswith("multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        # declared by the client, chunked uploads are counted below
+        content_length = headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > self.max_body_size:
+            response = JSONResponse({"detail": DETAIL}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    # re-raised by FastAPI while parsing the form
+                    raise HTTPException(status_code=413, detail=DETAIL)
+            return message
+
+        await self.app(scope, limited_receive, send)
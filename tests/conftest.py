@@ -0,0 +1,22 @@
+import os
+import tempfile
+
+import pytest
+
+# the configuration is read when silo is imported
+os.environ.setdefault("SILO_LDAP_SERVER_URI", "ldap://localhost")
+os.environ.setdefault("SILO_LDAP_BASE_DN", "dc=example,dc=org")
+os.environ.setdefault("SILO_LDAP_USER_DN_TEMPLATE", "uid={username},dc=example,dc=org")
+os.environ.setdefault("SILO_JWT_SECRET_KEY", "test-secret")
+os.environ.setdefault("SILO_LOG_DIRECTORY", tempfile.mkdtemp(prefix="silo-log-"))
+os.environ.setdefault(
+    "SILO_DOCUMENT_UPLOAD_DIRECTORY", tempfile.mkdtemp(prefix="silo-documents-")
+)
+# a PostgreSQL database which is dropped and recreated by the database tests
+if "SILO_TEST_DATABASE_URI" in os.environ:
+    os.environ["SILO_POSTGRES_DATABASE_URI"] = os.environ["SILO_TEST_DATABASE_URI"]
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
@@ -0,0 +1,65 @@
+from ipaddress import ip_network
+
+import pytest
+from fastapi import Request
+
+from silo import config
+from silo.utils.client_ip import get_client_ip
+
+
+def request(peer: str, *headers: tuple[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/v1/auth/login",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+            "client": (peer, 50000),
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def trusted_proxies(monkeypatch):
+    monkeypatch.setattr(
+        config, "trusted_proxies", [ip_network("10.0.0.0/8"), ip_network("fd00::/8")]
+    )
+
+
+def test_untrusted_peer_headers_are_ignored():
+    forged = request("198.51.100.7", ("X-Forwarded-For", "203.0.113.1"))
+
+    assert get_client_ip(forged) == "198.51.100.7"
+
+
+def test_right_most_untrusted_hop():
+    # the client can prepend any address, the proxies append theirs
+    r = request(
+        "10.0.0.2",
+        ("X-Forwarded-For", "192.0.2.99, 203.0.113.1"),
+        ("X-Forwarded-For", "10.0.0.3"),
+    )
+
+    assert get_client_ip(r) == "203.0.113.1"
+
+
+def test_forwarded_header():
+    r = request(
+        "10.0.0.2",
+        ("Forwarded", 'for="[2001:db8:cafe::17]:4711";proto=https, for=10.1.2.3'),
+    )
+
+    assert get_client_ip(r) == "2001:db8:cafe::17"
+
+
+def test_only_trusted_hops():
+    r = request("fd00::1", ("X-Forwarded-For", "10.0.0.5, 10.0.0.4"))
+
+    assert get_client_ip(r) == "10.0.0.5"
+
+
+def test_without_trusted_proxies(monkeypatch):
+    monkeypatch.setattr(config, "trusted_proxies", [])
+    r = request("10.0.0.2", ("X-Forwarded-For", "203.0.113.1"))
+
+    assert get_client_ip(r) == "10.0.0.2"
@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import Request
+
+from silo.api.v1.document import not_modified
+
+LAST_MODIFIED = datetime(2000, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc)
+ETAG = '"abc123"'
+
+
+def request(*headers: tuple[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/document/1/content",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "since, expected",
+    [
+        ("Sat, 01 Jan 2000 12:00:00 GMT", True),
+        ("Sat, 01 Jan 2000 11:59:59 GMT", False),
+        # no zone information, parsed as naive datetime
+        ("Sat, 01 Jan 2000 12:00:00 -0000", True),
+        ("Sat, 01 Jan 2000 00:00:00 -0000", False),
+        ("Sat, 01 Jan 2000 13:00:00 +0100", True),
+        ("yesterday", False),
+    ],
+)
+def test_if_modified_since(since, expected):
+    r = request(("If-Modified-Since", since))
+
+    assert not_modified(r, ETAG, LAST_MODIFIED) is expected
+
+
+def test_if_none_match_takes_precedence():
+    r = request(
+        ("If-None-Match", 'W/"other", "abc123"'),
+        ("If-Modified-Since", "Sat, 01 Jan 2000 00:00:00 GMT"),
+    )
+
+    assert not_modified(r, ETAG, LAST_MODIFIED)
+    assert not not_modified(request(("If-None-Match", '"other"')), ETAG, LAST_MODIFIED)
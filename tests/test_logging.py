@@ -0,0 +1,83 @@
+import json
+import logging
+import os
+from logging.handlers import QueueListener
+from queue import Queue
+
+import pytest
+
+from silo.log.app_logging import JSONFormatter, ProcessQueueHandler
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    return tmp_path / "silo.log"
+
+
+@pytest.fixture
+def queue_logger(log_file):
+    target = logging.FileHandler(log_file)
+    target.setFormatter(JSONFormatter())
+    handler = ProcessQueueHandler(Queue())
+    handler.listener = QueueListener(handler.queue, target)
+
+    logger = logging.getLogger("silo.tests.queue")
+    logger.propagate = False
+    logger.addHandler(handler)
+    yield logger, handler
+
+    logger.removeHandler(handler)
+    handler.stop_listener()
+    target.close()
+
+
+def records(log_file) -> list[dict]:
+    return [json.loads(line) for line in log_file.read_text().splitlines()]
+
+
+def test_records_are_written(queue_logger, log_file):
+    logger, handler = queue_logger
+
+    logger.warning("disk %s is full", "/data")
+    handler.stop_listener()
+
+    [record] = records(log_file)
+    assert record["message"] == "disk /data is full"
+    assert record["level"] == "WARNING"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_process_starts_its_own_listener(queue_logger, log_file):
+    logger, handler = queue_logger
+    # the master has a running listener when the workers are forked
+    logger.info("master")
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            logger.info("worker")
+            handler.stop_listener()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+    handler.stop_listener()
+    assert sorted(record["message"] for record in records(log_file)) == [
+        "master",
+        "worker",
+    ]
+
+
+def test_exception_is_a_separate_field(queue_logger, log_file):
+    logger, handler = queue_logger
+
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("dividing %d failed", 1)
+    handler.stop_listener()
+
+    [record] = records(log_file)
+    assert record["message"] == "dividing 1 failed"
+    assert record["exception"].startswith("Traceback (most recent call last)")
+    assert record["exception"].endswith("ZeroDivisionError: division by zero")
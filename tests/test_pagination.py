@@ -0,0 +1,58 @@
+import base64
+import json
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from silo.database import models
+from silo.schemas import CursorParams
+from silo.utils import sort_keys
+from silo.utils.pagination import decode_cursor, encode_cursor
+
+
+def cursor_of(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def test_cursor_round_trip():
+    keys = sort_keys(models.Item, "updated_at")
+    values = [datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc), 42]
+
+    assert decode_cursor(encode_cursor(values), keys) == values
+
+
+@pytest.mark.parametrize(
+    "order_by, payload",
+    [
+        ("id", ["1"]),
+        ("id", [True]),
+        ("id", [1.5]),
+        ("id", [2**31]),
+        ("id", [None]),
+        ("id", [1, 2]),
+        ("updated_at", [{"dt": "2025-01-02T03:04:05"}, 1]),
+        ("updated_at", [{"dt": "yesterday"}, 1]),
+        ("updated_at", [{"dt": 5}, 1]),
+        ("updated_at", ["2025-01-02T03:04:05+00:00", 1]),
+        ("updated_at", [{"dt": "2025-01-02T03:04:05+00:00"}, "1"]),
+    ],
+)
+def test_tampered_cursor_is_rejected(order_by, payload):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor_of(payload), sort_keys(models.Item, order_by))
+
+    assert error.value.status_code == 400
+
+
+def test_invalid_base64_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        decode_cursor("%%%", sort_keys(models.Item))
+
+    assert error.value.status_code == 400
+
+
+def test_cursor_pagination_is_opt_in():
+    assert not CursorParams().paged
+    assert not CursorParams(limit=10).paged
+    assert CursorParams(cursor="").paged
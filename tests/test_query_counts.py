@@ -0,0 +1,268 @@
+import os
+import re
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+# runs the endpoints against a real database, which is dropped and recreated
+pytestmark = [
+    pytest.mark.anyio,
+    pytest.mark.skipif(
+        "SILO_TEST_DATABASE_URI" not in os.environ,
+        reason="SILO_TEST_DATABASE_URI (PostgreSQL test database) is not set",
+    ),
+]
+
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def query_count(response: httpx.Response) -> int:
+    # QueryStats.count of the request, sent by the middleware
+    match = SERVER_TIMING_QUERIES.search(response.headers["Server-Timing"])
+    assert match is not None, response.headers["Server-Timing"]
+    return int(match.group(1))
+
+
+async def reset_database() -> None:
+    from silo.database import async_engine
+    from silo.database.models import Base
+    from silo.startup import add_default_roles, create_tables
+
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await create_tables()
+    await add_default_roles()
+
+
+async def add_admin():
+    from silo.database import local_session, models
+    from silo.database.loaders import USER_LOAD
+    from silo.schemas import UserRead
+
+    async with local_session() as session:
+        admin_role = await session.scalar(
+            select(models.Role).where(models.Role.name == "admin")
+        )
+        user = models.User(username="admin")
+        user.roles.append(admin_role)
+        session.add(user)
+        await session.commit()
+
+        user = await session.scalar(
+            select(models.User).options(*USER_LOAD).where(models.User.id == user.id)
+        )
+        return UserRead.model_validate(user, from_attributes=True)
+
+
+async def add_document(item_id: int, user_id: int) -> int:
+    from silo.database import local_session, models
+    from silo.schemas.Document import DocumentMimeTypes, DocumentType
+
+    async with local_session() as session:
+        document = models.Document(
+            filename="manual.pdf",
+            title="Manual",
+            description="Operating manual",
+            file_size=4,
+            mime_type=DocumentMimeTypes.PDF,
+            file_path="00/00/manual",
+            item_id=item_id,
+            user_id=user_id,
+            document_type=DocumentType.MANUAL,
+        )
+        session.add(document)
+        await session.commit()
+        return document.id
+
+
+async def post(client: httpx.AsyncClient, url: str, json: dict) -> dict:
+    response = await client.post(url, json=json)
+    assert response.status_code in (200, 201), response.text
+    return response.json()
+
+
+@pytest.fixture(scope="module")
+async def api():
+    from silo.api.dependencies import get_current_user
+    from silo.database import async_engine
+    from silo.main import app
+
+    await reset_database()
+    admin = await add_admin()
+    app.dependency_overrides[get_current_user] = lambda: admin
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test/api/v1"
+    ) as client:
+        room = await post(client, "/room/", {"name": "Lab", "description": "Lab"})
+        storage_type = await post(client, "/storagetype/", {"name": "Shelf"})
+        furniture = await post(
+            client,
+            "/storagefurniture/",
+            {
+                "name": "Shelf 1",
+                "room_id": room["id"],
+                "storage_type_id": storage_type["id"],
+            },
+        )
+        areas = [
+            await post(
+                client,
+                "/storagearea/",
+                {
+                    "area": f"Board {n}",
+                    "room_id": room["id"],
+                    "furniture_id": furniture["id"],
+                },
+            )
+            for n in range(3)
+        ]
+        item_type = await post(
+            client, "/itemtype/", {"name": "Tool", "description": "Tools"}
+        )
+        pool = await post(client, "/pool/", {"name": "Lab", "description": "Lab"})
+        tags = [
+            await post(client, "/tag/", {"name": f"tag {n}", "color_hex": "#ffffff"})
+            for n in range(2)
+        ]
+        items = []
+        for n in range(5):
+            item = await post(
+                client,
+                "/item/",
+                {
+                    "name": f"Screwdriver {n}",
+                    "description": "Phillips",
+                    "quantity": 1,
+                    "type_id": item_type["id"],
+                    "pool_id": pool["id"],
+                    "storage_area_id": areas[n % len(areas)]["id"],
+                },
+            )
+            for tag in tags:
+                item = await post(client, f"/item/{item['id']}/tags/{tag['id']}", {})
+            items.append(item)
+        comment = await post(
+            client, "/comment/", {"comment": "Checked", "item_id": items[0]["id"]}
+        )
+        document_id = await add_document(items[0]["id"], admin.id)
+
+        yield (
+            client,
+            {
+                "room": room,
+                "storagetype": storage_type,
+                "storagefurniture": furniture,
+                "storagearea": areas[0],
+                "itemtype": item_type,
+                "pool": pool,
+                "tag": tags[0],
+                "item": items[0],
+                "comment": comment,
+                "document": {"id": document_id},
+                "user": {"id": admin.id},
+                "role": {"id": admin.roles[0].id},
+            },
+            len(items),
+        )
+
+    app.dependency_overrides.pop(get_current_user, None)
+    await async_engine.dispose()
+
+
+# queries per endpoint, independent of the number of rows (no N+1)
+QUERIES = {
+    "room": 1,
+    "storagetype": 1,
+    "storagefurniture": 1,
+    "storagearea": 1,
+    "itemtype": 1,
+    "pool": 1,
+    "tag": 1,
+    "role": 1,
+    "comment": 1,
+    "document": 1,
+    # the relationships collections are loaded with an additional SELECT ... IN
+    "item": 2,
+    "user": 2,
+}
+
+
+@pytest.mark.parametrize("entity", QUERIES)
+async def test_list(api, entity):
+    client, _, _ = api
+
+    response = await client.get(f"/{entity}/")
+
+    assert response.status_code == 200, response.text
+    assert isinstance(response.json(), list)
+    assert response.json()
+    assert query_count(response) == QUERIES[entity]
+
+
+@pytest.mark.parametrize("entity", QUERIES)
+async def test_list_page(api, entity):
+    client, _, _ = api
+
+    response = await client.get(f"/{entity}/", params={"cursor": "", "limit": 1})
+
+    assert response.status_code == 200, response.text
+    page = response.json()
+    assert len(page["items"]) == 1
+    assert query_count(response) == QUERIES[entity]
+
+
+@pytest.mark.parametrize("entity", QUERIES)
+async def test_detail(api, entity):
+    client, seeded, _ = api
+
+    response = await client.get(f"/{entity}/{seeded[entity]['id']}")
+
+    assert response.status_code == 200, response.text
+    assert response.json()["id"] == seeded[entity]["id"]
+    assert query_count(response) == QUERIES[entity]
+
+
+async def test_item_relationships(api):
+    client, seeded, items = api
+
+    response = await client.get("/item/")
+
+    assert len(response.json()) == items
+    for item in response.json():
+        assert item["storage_area"]["room"]["id"] == seeded["room"]["id"]
+        assert (
+            item["storage_area"]["furniture"]["id"]
+            == (seeded["storagefurniture"]["id"])
+        )
+        assert len(item["tags"]) == 2
+
+
+async def test_user_roles(api):
+    client, seeded, _ = api
+
+    response = await client.get(f"/user/{seeded['user']['id']}")
+
+    assert [role["name"] for role in response.json()["roles"]] == ["admin"]
+
+
+async def test_item_by_silo_id(api):
+    client, seeded, _ = api
+
+    response = await client.get(f"/item/by-silo-id/{seeded['item']['silo_id']}")
+
+    assert response.status_code == 200, response.text
+    assert response.json()["id"] == seeded["item"]["id"]
+    assert query_count(response) == 2
+
+
+async def test_item_search(api):
+    client, _, items = api
+
+    response = await client.get("/item/search", params={"term": "Screwdriver"})
+
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == items
+    assert query_count(response) == 2
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from silo.database import PrimarySession
+from silo.security.jwt import decode_token
+from silo.security.sessions import (
+    InvalidSessionError,
+    _revoke_on_commit,
+    create_session,
+    revoke_session,
+    rotate_session,
+    revoked_sessions,
+)
+
+requires_database = pytest.mark.skipif(
+    "SILO_TEST_DATABASE_URI" not in os.environ,
+    reason="SILO_TEST_DATABASE_URI (PostgreSQL test database) is not set",
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    revoked_sessions.replace(set())
+    yield
+    revoked_sessions.replace(set())
+
+
+@pytest.mark.anyio
+async def test_revocation_is_cached_after_commit():
+    async with AsyncSession(sync_session_class=PrimarySession) as db:
+        # revoke_session() runs in the transaction of its UPDATE
+        await db.begin()
+        _revoke_on_commit(db, {"family-1", "family-2"})
+        assert "family-1" not in revoked_sessions
+
+        await db.commit()
+
+    assert "family-1" in revoked_sessions
+    assert "family-2" in revoked_sessions
+
+
+@pytest.mark.anyio
+async def test_rolled_back_revocation_is_not_cached():
+    async with AsyncSession(sync_session_class=PrimarySession) as db:
+        await db.begin()
+        _revoke_on_commit(db, {"family-1"})
+        await db.rollback()
+        await db.commit()
+
+    assert "family-1" not in revoked_sessions
+
+
+@pytest.fixture
+async def login():
+    from silo.database import async_engine, local_session, models
+    from silo.startup import create_tables
+
+    await create_tables()
+    async with local_session() as db:
+        user = models.User(username=f"u{uuid.uuid4().hex[:12]}")
+        db.add(user)
+        await db.commit()
+
+        token, family_id = create_session(db, user.id)
+        await db.commit()
+
+    yield decode_token(token), family_id
+
+    await async_engine.dispose()
+
+
+async def refresh(payload: dict) -> dict:
+    from silo.database import local_session
+
+    async with local_session() as db:
+        token, _, _ = await rotate_session(db, payload)
+        await db.commit()
+    return decode_token(token)
+
+
+@requires_database
+@pytest.mark.anyio
+async def test_concurrent_refreshes(login):
+    payload, family_id = login
+
+    first, second = await asyncio.gather(refresh(payload), refresh(payload))
+
+    assert first["jti"] != second["jti"]
+    assert first["fam"] == second["fam"] == family_id
+    assert family_id not in revoked_sessions
+    # both tabs keep working
+    await refresh(first)
+    await refresh(second)
+
+
+@requires_database
+@pytest.mark.anyio
+async def test_reuse_after_grace_period_revokes(login):
+    from silo.database import local_session, models
+
+    payload, family_id = login
+    await refresh(payload)
+    async with local_session() as db:
+        await db.execute(
+            update(models.Session)
+            .where(models.Session.jti == payload["jti"])
+            .values(rotated_at=models.Session.rotated_at - timedelta(minutes=1))
+        )
+        await db.commit()
+
+    with pytest.raises(InvalidSessionError):
+        await refresh(payload)
+    assert family_id in revoked_sessions
+
+
+@requires_database
+@pytest.mark.anyio
+async def test_reuse_of_an_older_token_revokes(login):
+    payload, family_id = login
+    successor = await refresh(payload)
+    await refresh(successor)
+
+    # within the grace period, but not the immediately preceding token
+    with pytest.raises(InvalidSessionError):
+        await refresh(payload)
+    assert family_id in revoked_sessions
+
+
+@requires_database
+@pytest.mark.anyio
+async def test_revoked_session_is_not_refreshed(login):
+    from silo.database import local_session
+
+    payload, family_id = login
+    await refresh(payload)
+    async with local_session() as db:
+        await revoke_session(db, family_id)
+        await db.commit()
+
+    with pytest.raises(InvalidSessionError):
+        await refresh(payload)
@@ -0,0 +1,98 @@
+import httpx
+import pytest
+from fastapi import FastAPI, UploadFile
+
+from silo.utils.upload_limit import MULTIPART_OVERHEAD, UploadSizeLimitMiddleware
+
+MAX_FILE_SIZE = 1024
+BOUNDARY = "silo-test-boundary"
+
+app = FastAPI()
+app.add_middleware(UploadSizeLimitMiddleware, max_file_size=MAX_FILE_SIZE)
+uploads: list[int] = []
+
+
+@app.post("/upload")
+async def upload(file: UploadFile) -> dict:
+    uploads.append(file.size)
+    return {"size": file.size}
+
+
+@app.post("/echo")
+async def echo(body: dict) -> dict:
+    return body
+
+
+def multipart(size: int) -> list[bytes]:
+    return [
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="a.pdf"\r\n'
+        "Content-Type: application/pdf\r\n\r\n".encode(),
+        *[b"a" * 4096] * (size // 4096),
+        b"a" * (size % 4096),
+        f"\r\n--{BOUNDARY}--\r\n".encode(),
+    ]
+
+
+async def stream(parts: list[bytes]):
+    for part in parts:
+        yield part
+
+
+def client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+HEADERS = {"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"}
+
+
+@pytest.fixture(autouse=True)
+def clear_uploads():
+    uploads.clear()
+
+
+@pytest.mark.anyio
+async def test_upload_within_limit():
+    async with client() as c:
+        response = await c.post(
+            "/upload", content=b"".join(multipart(MAX_FILE_SIZE)), headers=HEADERS
+        )
+
+    assert response.status_code == 200
+    assert uploads == [MAX_FILE_SIZE]
+
+
+@pytest.mark.anyio
+async def test_content_length_above_limit():
+    size = MAX_FILE_SIZE + MULTIPART_OVERHEAD + 1
+    async with client() as c:
+        response = await c.post(
+            "/upload", content=b"".join(multipart(size)), headers=HEADERS
+        )
+
+    assert response.status_code == 413
+    assert uploads == []
+
+
+@pytest.mark.anyio
+async def test_streamed_body_above_limit():
+    # chunked transfer encoding, without a Content-Length
+    size = MAX_FILE_SIZE + MULTIPART_OVERHEAD + 1
+    async with client() as c:
+        response = await c.post(
+            "/upload", content=stream(multipart(size)), headers=HEADERS
+        )
+
+    assert response.status_code == 413
+    assert uploads == []
+
+
+@pytest.mark.anyio
+async def test_other_bodies_are_not_limited():
+    body = {"text": "a" * (MAX_FILE_SIZE + MULTIPART_OVERHEAD)}
+    async with client() as c:
+        response = await c.post("/echo", json=body)
+
+    assert response.status_code == 200